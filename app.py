@@ -1,6 +1,9 @@
 import streamlit as st
-import pandas as pd
+import hashlib
+import os
+import tempfile
 from data_processor import DataProcessor
+from src.utils.job_store import JobStore
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
@@ -67,17 +70,9 @@ def validate_data(df):
     # Convert column names to lowercase and remove spaces/special characters
     df.columns = df.columns.str.lower().str.strip().str.replace('[^a-z0-9]', '_')
     
-    # Specific mapping for the provided CSV columns
-    column_mapping = {
-        'job_title': 'job_title',
-        'company_name': 'company',
-        'location': 'location',
-        'tech_stack': 'tech_stack'
-    }
-    
     # Apply the mapping
     try:
-        df.rename(columns=column_mapping, inplace=True)
+        df.rename(columns=DataProcessor.UPLOAD_COLUMN_MAPPINGS, inplace=True)
     except KeyError as e:
         return False, f"Column mapping failed: {str(e)}"
     
@@ -97,19 +92,98 @@ def validate_data(df):
         
     return True, ""
 
+# Uploads kept in the caches below; the least recently used one is evicted first
+CACHE_ENTRIES = 8
+
+def file_hash(uploaded_file):
+    """Content hash of an upload, the key for everything cached about it"""
+    return hashlib.md5(uploaded_file.getvalue()).hexdigest()
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def open_job_store(digest, _uploaded_file):
+    """Copy an uploaded SQLite job store to a temp file so it can be queried in place"""
+    path = os.path.join(tempfile.gettempdir(), f"job_store_{digest}.db")
+    if not os.path.exists(path):
+        with open(path, 'wb') as f:
+            f.write(_uploaded_file.getvalue())
+    return JobStore(path)
+
+# Kept as a shared object rather than copied out on every rerun; nothing below modifies it
+@st.cache_resource(max_entries=CACHE_ENTRIES, show_spinner="Loading data...")
+def load_uploaded_data(digest, name, _uploaded_file):
+    """Read, validate and prepare an uploaded CSV or Parquet file; returns (df, error_message)"""
+    # Load only the columns the dashboard uses, as strings to avoid type inference issues
+    _uploaded_file.seek(0)
+    raw_df = DataProcessor.read_columns(_uploaded_file)
+    
+    # Validate data
+    is_valid, error_message = validate_data(raw_df)
+    if not is_valid:
+        return None, error_message
+    
+    # Process data if valid
+    df = raw_df.copy()
+    # Add city extraction from location
+    df['city'] = df['location'].str.split(',').str[0]
+    # Convert tech_stack to list if it's not already
+    if 'technologies' not in df.columns:
+        df['technologies'] = df['tech_stack'].str.split(',').apply(lambda x: [t.strip() for t in x] if isinstance(x, list) else [])
+    return df, ""
+
+@st.cache_data(max_entries=CACHE_ENTRIES)
+def filter_options(digest, _df):
+    """Cities and technologies offered by the sidebar filters"""
+    return sorted(_df['city'].unique()), DataProcessor._calculate_tech_demand(_df).index.sort_values().tolist()
+
+@st.cache_data(max_entries=CACHE_ENTRIES, show_spinner="Calculating KPIs...")
+def compute_kpis(digest, cities, techs, _df):
+    """KPIs and summary metrics for an upload, restricted to the selected cities and technologies"""
+    df = _df
+    if cities:
+        df = df[df['city'].isin(cities)]
+    if techs:
+        df = df[df['technologies'].apply(lambda job_techs: any(tech in techs for tech in job_techs))]
+    summary = {
+        'total_jobs': len(df),
+        'unique_companies': df['company'].nunique(),
+        'locations': df['location'].nunique()
+    }
+    return DataProcessor.calculate_kpis(df), summary
+
+@st.cache_data(max_entries=CACHE_ENTRIES, show_spinner="Calculating KPIs...")
+def compute_store_kpis(digest, cities, techs, _store):
+    """Same as compute_kpis, aggregated in SQL by an uploaded job store"""
+    return DataProcessor.calculate_kpis_from_store(_store, cities, techs), _store.summary(cities, techs)
+
 def main():
     st.markdown("<h1 class='main-title'>Tech Job Market Analytics Dashboard</h1>", unsafe_allow_html=True)
 
     # Sidebar configuration
     with st.sidebar:
         st.header("📊 Dashboard Controls")
-        uploaded_file = st.file_uploader("Upload LinkedIn Jobs Data (CSV)", type=['csv'])
+        uploaded_file = st.file_uploader("Upload LinkedIn Jobs Data (CSV, Parquet or SQLite job store)",
+                                         type=['csv', 'parquet', 'db'])
         
         st.markdown("---")
         st.markdown("### 🔍 Filters")
-        if 'df' in locals():
-            city_filter = st.multiselect("Filter by City", df['city'].unique())
-            tech_filter = st.multiselect("Filter by Technology", sorted(list(set([tech for techs in df['technologies'] for tech in techs]))))
+        store, df, error_message = None, None, ""
+        city_filter, tech_filter = [], []
+        if uploaded_file:
+            digest = file_hash(uploaded_file)
+        if uploaded_file and uploaded_file.name.lower().endswith('.db'):
+            # Filters on a job store are applied in SQL, before anything is aggregated
+            store = open_job_store(digest, uploaded_file)
+            city_filter = st.multiselect("Filter by City", store.cities())
+            tech_filter = st.multiselect("Filter by Technology", store.technologies())
+        elif uploaded_file:
+            try:
+                df, error_message = load_uploaded_data(digest, uploaded_file.name.lower(), uploaded_file)
+            except Exception as e:
+                error_message = f"Error processing data: {str(e)}"
+            if df is not None:
+                cities, technologies = filter_options(digest, df)
+                city_filter = st.multiselect("Filter by City", cities)
+                tech_filter = st.multiselect("Filter by Technology", technologies)
         
         st.markdown("---")
         st.markdown("### ℹ️ About")
@@ -117,24 +191,15 @@ def main():
 
     if uploaded_file:
         try:
-            # Load CSV with all string columns to avoid type inference issues
-            raw_df = pd.read_csv(uploaded_file, dtype=str)
-            
-            # Validate data
-            is_valid, error_message = validate_data(raw_df)
-            if not is_valid:
+            # Cached per upload and filter selection, so switching tabs or filters back is instant
+            filters = (tuple(sorted(city_filter)), tuple(sorted(tech_filter)))
+            if store is not None:
+                kpis, summary = compute_store_kpis(digest, *filters, store)
+            elif df is None:
                 st.error(error_message)
                 return
-            
-            # Process data if valid
-            df = raw_df.copy()
-            # Add city extraction from location
-            df['city'] = df['location'].str.split(',').str[0]
-            # Convert tech_stack to list if it's not already
-            if 'technologies' not in df.columns:
-                df['technologies'] = df['tech_stack'].str.split(',').apply(lambda x: [t.strip() for t in x] if isinstance(x, list) else [])
-            
-            kpis = DataProcessor.calculate_kpis(df)
+            else:
+                kpis, summary = compute_kpis(digest, *filters, df)
             
             # Market Insights Section
             st.markdown("<h2 class='section-title'>Advanced Market Insights</h2>", unsafe_allow_html=True)
@@ -142,14 +207,14 @@ def main():
             # KPI Dashboard
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Total Job Postings", len(df))
-                st.metric("Unique Companies", df['company'].nunique())
+                st.metric("Total Job Postings", summary['total_jobs'])
+                st.metric("Unique Companies", summary['unique_companies'])
             with col2:
                 st.metric("Unique Technologies", len(kpis['tech_demand']))
                 st.metric("Rare Skills Found", len(kpis['rare_skills']))
             with col3:
                 st.metric("Technology Clusters", len(kpis['tech_clustering']))
-                st.metric("Locations", df['location'].nunique())
+                st.metric("Locations", summary['locations'])
 
             # Improved Tabs Structure
             tab1, tab2, tab3 = st.tabs([
@@ -0,0 +1,65 @@
+"""Per-page parse time for each installed HTML parser backend.
+
+Usage: python benchmark_parsers.py [search_page.html] [job_page.html]
+
+Without arguments, synthetic pages shaped like LinkedIn's guest search
+results (25 cards) and job view pages are used.
+"""
+import sys
+import time
+from src.utils.html_parser import available_backends, parse_html
+
+ROUNDS = 50
+
+def synthetic_search_page(cards: int = 25) -> str:
+    card_html = ''.join(f'''
+        <li><div class="base-card relative w-full base-search-card--link job-search-card">
+          <a class="base-card__full-link" href="https://in.linkedin.com/jobs/view/data-engineer-at-acme-{4000000000 + i}?refId=abc"></a>
+          <div class="base-search-card__info">
+            <h3 class="base-search-card__title">Data Engineer {i}</h3>
+            <h4 class="base-search-card__subtitle"><a class="hidden-nested-link">Acme {i}</a></h4>
+            <div class="base-search-card__metadata">
+              <span class="job-search-card__location">Bengaluru, Karnataka, India</span>
+              <time class="job-search-card__listdate" datetime="2025-01-01">1 week ago</time>
+            </div>
+          </div>
+        </div></li>''' for i in range(cards))
+    scripts = '<script>' + 'var tracking = {};' * 4000 + '</script>'
+    return f'<html><head>{scripts}</head><body><ul class="jobs-search__results-list">{card_html}</ul></body></html>'
+
+def synthetic_job_page() -> str:
+    description = '<p>We are looking for a Data Engineer with Python, Spark and Airflow.</p>' * 40
+    sidebar = ''.join(f'<li><div class="base-card">Similar job {i}</div></li>' for i in range(200))
+    scripts = '<script>' + 'var tracking = {};' * 8000 + '</script>'
+    return (f'<html><head>{scripts}</head><body><section class="description">'
+            f'<div class="description__text"><div class="show-more-less-html__markup">{description}</div></div>'
+            f'</section><aside><ul>{sidebar}</ul></aside></body></html>')
+
+def parse_search_page(markup: str, backend: str) -> int:
+    cards = parse_html(markup, backend).select('div.base-card')
+    for card in cards:
+        card.select_one('h3.base-search-card__title').text()
+        card.select_one('a.base-card__full-link').attr('href')
+    return len(cards)
+
+def parse_job_page(markup: str, backend: str) -> int:
+    return len(parse_html(markup, backend).select_one('div.description__text').text())
+
+def benchmark(label: str, func, markup: str):
+    print(f"\n{label} ({len(markup) / 1024:.0f} KB)")
+    for backend in available_backends():
+        func(markup, backend)
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            func(markup, backend)
+        elapsed_ms = (time.perf_counter() - start) / ROUNDS * 1000
+        print(f"  {backend:<12} {elapsed_ms:8.2f} ms/page")
+
+def main():
+    search_markup = open(sys.argv[1], encoding='utf-8').read() if len(sys.argv) > 1 else synthetic_search_page()
+    job_markup = open(sys.argv[2], encoding='utf-8').read() if len(sys.argv) > 2 else synthetic_job_page()
+    benchmark("Search results page", parse_search_page, search_markup)
+    benchmark("Job description page", parse_job_page, job_markup)
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,16 @@
 import pandas as pd
 import numpy as np
-from collections import Counter
-import networkx as nx
 import plotly.express as px
 import plotly.graph_objects as go
 import os
 from llm_analyzer import LLMAnalyzer
+from src.utils.analysis_context import AnalysisContext
+from src.utils.cooccurrence import TechCooccurrence
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
 
 class DataProcessor:
     CITY_COORDINATES = {
@@ -21,37 +26,73 @@ class DataProcessor:
         'Ahmedabad': {'lat': 23.0225, 'lon': 72.5714}
     }
 
+    # Map various possible input column names to our standard names
+    COLUMN_MAPPINGS = {
+        'Job Title': 'job_title',
+        'Title': 'job_title',
+        'Position': 'job_title',
+        'Role': 'job_title',
+        
+        'Company Name': 'company',
+        'Company': 'company',
+        'Employer': 'company',
+        'Organization': 'company',
+        
+        'Location': 'location',
+        'Place': 'location',
+        'City': 'location',
+        
+        'Tech Stack': 'tech_stack',
+        'Technologies': 'tech_stack',
+        'Skills': 'tech_stack',
+        'Requirements': 'tech_stack'
+    }
+
+    # Lower-cased headers the dashboard's validate_data maps on its own
+    UPLOAD_COLUMN_MAPPINGS = {
+        'job_title': 'job_title',
+        'company_name': 'company',
+        'location': 'location',
+        'tech_stack': 'tech_stack'
+    }
+
+    # The only columns the analyses read; links and descriptions are never loaded
+    ANALYSIS_COLUMNS = ['job_title', 'company', 'location', 'tech_stack', 'technologies', 'date_posted']
+
+    # Technology clustering: pairs seen in fewer than CLUSTER_MIN_WEIGHT postings, or in less than
+    # CLUSTER_MIN_SHARE of the rarer technology's postings, are pruned before Louvain runs
+    CLUSTER_MIN_WEIGHT = 2
+    CLUSTER_MIN_SHARE = 0.05
+    CLUSTER_RESOLUTION = 1.0
+    CLUSTER_SEED = 42
+
+    @staticmethod
+    def _is_analysis_column(column):
+        # Keep every header either load_data or the dashboard's validate_data can rename
+        name = str(column).lower().strip()
+        return (DataProcessor.COLUMN_MAPPINGS.get(column, column) in DataProcessor.ANALYSIS_COLUMNS
+                or DataProcessor.UPLOAD_COLUMN_MAPPINGS.get(name, name) in DataProcessor.ANALYSIS_COLUMNS)
+
+    @staticmethod
+    def read_columns(file):
+        """Read only the analysed columns from a Parquet or CSV file"""
+        name = str(getattr(file, 'name', file)).lower()
+        if name.endswith('.parquet'):
+            parquet_file = pq.ParquetFile(file)
+            columns = [col for col in parquet_file.schema_arrow.names if DataProcessor._is_analysis_column(col)]
+            # List cells arrive as numpy string arrays, which the analyses iterate like lists
+            return parquet_file.read(columns=columns).to_pandas()
+        # Strings throughout: the CSV carries no numeric columns worth inferring
+        return pd.read_csv(file, usecols=DataProcessor._is_analysis_column, dtype=str)
+
     @staticmethod
     def load_data(file):
-        """Load and validate data from CSV file"""
+        """Load and validate data from a CSV or Parquet file"""
         try:
-            df = pd.read_csv(file)
-            
-            # Standardize column names
-            column_mappings = {
-                # Map various possible input column names to our standard names
-                'Job Title': 'job_title',
-                'Title': 'job_title',
-                'Position': 'job_title',
-                'Role': 'job_title',
-                
-                'Company Name': 'company',
-                'Company': 'company',
-                'Employer': 'company',
-                'Organization': 'company',
-                
-                'Location': 'location',
-                'Place': 'location',
-                'City': 'location',
-                
-                'Tech Stack': 'tech_stack',
-                'Technologies': 'tech_stack',
-                'Skills': 'tech_stack',
-                'Requirements': 'tech_stack'
-            }
+            df = DataProcessor.read_columns(file)
             
             # Rename columns if they exist in the mapping
-            df = df.rename(columns=lambda x: column_mappings.get(x, x))
+            df = df.rename(columns=lambda x: DataProcessor.COLUMN_MAPPINGS.get(x, x))
             
             # Ensure required columns exist
             required_columns = ['job_title', 'company', 'location', 'tech_stack']
@@ -65,10 +106,11 @@ class DataProcessor:
             df['location'] = df['location'].fillna('Not specified').astype(str).str.strip()
             df['tech_stack'] = df['tech_stack'].fillna('Not specified').astype(str).str.strip()
             
-            # Create technologies list
-            df['technologies'] = df['tech_stack'].apply(lambda x: 
-                [item.strip() for item in str(x).split(',') if item.strip()] if pd.notna(x) else []
-            )
+            # Create technologies list (Parquet files already store it as a list column)
+            if 'technologies' not in df.columns:
+                df['technologies'] = df['tech_stack'].apply(lambda x: 
+                    [item.strip() for item in str(x).split(',') if item.strip()] if pd.notna(x) else []
+                )
             
             return df
             
@@ -78,20 +120,36 @@ class DataProcessor:
 
     @staticmethod
     def calculate_kpis(df):
+        context = AnalysisContext.for_frame(df)
         kpis = {
-            'tech_demand': DataProcessor._calculate_tech_demand(df),
+            'tech_demand': DataProcessor._calculate_tech_demand(df, context),
             'company_hiring_velocity': DataProcessor._calculate_hiring_velocity(df),
             'location_concentration': DataProcessor._calculate_location_concentration(df),
-            'skill_correlation': DataProcessor._calculate_skill_correlation(df),
-            'rare_skills': DataProcessor._find_rare_skills(df),
-            'tech_clustering': DataProcessor._cluster_technologies(df)
+            'skill_correlation': DataProcessor._calculate_skill_correlation(df, context),
+            'rare_skills': DataProcessor._find_rare_skills(df, context),
+            'tech_clustering': DataProcessor._cluster_technologies(df, context)
         }
         return kpis
 
     @staticmethod
-    def _calculate_tech_demand(df):
-        all_tech = [tech for techs in df['technologies'] for tech in techs]
-        return pd.Series(Counter(all_tech)).sort_values(ascending=False)
+    def calculate_kpis_from_store(store, cities=None, techs=None):
+        """Same KPIs as calculate_kpis, aggregated in SQL by a JobStore and optionally filtered"""
+        tech_demand = store.tech_demand(cities, techs)
+        tech_pairs = store.tech_pairs(cities, techs)
+        cooccurrence = TechCooccurrence.from_pair_counts(tech_pairs, tech_demand)
+        kpis = {
+            'tech_demand': tech_demand,
+            'company_hiring_velocity': store.hiring_velocity(cities, techs),
+            'location_concentration': store.location_concentration(cities, techs),
+            'skill_correlation': tech_pairs,
+            'rare_skills': tech_demand[tech_demand <= 3].to_dict(),
+            'tech_clustering': DataProcessor._cluster_cooccurrence(cooccurrence)
+        }
+        return kpis
+
+    @staticmethod
+    def _calculate_tech_demand(df, context=None):
+        return (context or AnalysisContext.for_frame(df)).tech_counts
 
     @staticmethod
     def _calculate_hiring_velocity(df):
@@ -116,38 +174,34 @@ class DataProcessor:
         return location_stats
 
     @staticmethod
-    def _calculate_skill_correlation(df):
-        tech_pairs = []
-        for techs in df['technologies']:
-            for i in range(len(techs)):
-                for j in range(i+1, len(techs)):
-                    tech_pairs.append(tuple(sorted([techs[i], techs[j]])))
-        return pd.Series(Counter(tech_pairs))
+    def _calculate_skill_correlation(df, context=None):
+        return (context or AnalysisContext.for_frame(df)).pair_counts
 
     @staticmethod
-    def _find_rare_skills(df):
-        all_tech = [tech for techs in df['technologies'] for tech in techs]
-        tech_counts = Counter(all_tech)
-        return {tech: count for tech, count in tech_counts.items() if count <= 3}
+    def _find_rare_skills(df, context=None):
+        tech_counts = (context or AnalysisContext.for_frame(df)).tech_counts
+        return tech_counts[tech_counts <= 3].to_dict()
 
     @staticmethod
-    def _cluster_technologies(df):
-        G = nx.Graph()
-        for techs in df['technologies']:
-            for i in range(len(techs)):
-                for j in range(i+1, len(techs)):
-                    if not G.has_edge(techs[i], techs[j]):
-                        G.add_edge(techs[i], techs[j], weight=1)
-                    else:
-                        G[techs[i]][techs[j]]['weight'] += 1
-        return list(nx.community.greedy_modularity_communities(G))
+    def _cluster_technologies(df, context=None):
+        return DataProcessor._cluster_cooccurrence((context or AnalysisContext.for_frame(df)).cooccurrence)
+
+    @staticmethod
+    def _cluster_cooccurrence(cooccurrence):
+        return cooccurrence.communities(
+            min_weight=DataProcessor.CLUSTER_MIN_WEIGHT,
+            min_share=DataProcessor.CLUSTER_MIN_SHARE,
+            resolution=DataProcessor.CLUSTER_RESOLUTION,
+            seed=DataProcessor.CLUSTER_SEED
+        )
 
     @staticmethod
     def generate_visualizations(df: pd.DataFrame) -> dict:
         plots = {}
+        context = AnalysisContext.for_frame(df)
         
         # 1. Job Distribution by City
-        city_counts = df['city'].value_counts().head(10)
+        city_counts = context.cities.value_counts().head(10)
         plots['city_distribution'] = px.bar(
             x=city_counts.index,
             y=city_counts.values,
@@ -157,8 +211,8 @@ class DataProcessor:
         )
 
         # 2. Technology Distribution
-        tech_counts = Counter([tech for techs in df['technologies'] for tech in techs]).most_common(15)
-        tech_df = pd.DataFrame(tech_counts, columns=['Technology', 'Count'])
+        tech_counts = context.tech_counts.head(15)
+        tech_df = pd.DataFrame({'Technology': tech_counts.index, 'Count': tech_counts.values})
         plots['tech_distribution'] = px.bar(
             tech_df,
             x='Technology',
@@ -179,8 +233,7 @@ class DataProcessor:
 
         # 4. Technology Trends Over Time (if date column exists)
         if 'date_posted' in df.columns:
-            df['date_posted'] = pd.to_datetime(df['date_posted'])
-            tech_trends = df.groupby('date_posted')['technologies'].agg(lambda x: len([item for sublist in x for item in sublist]))
+            tech_trends = context.techs_per_job.groupby(pd.to_datetime(df['date_posted'])).sum()
             plots['tech_trends'] = px.line(
                 x=tech_trends.index,
                 y=tech_trends.values,
@@ -194,30 +247,20 @@ class DataProcessor:
     @staticmethod
     def extract_advanced_insights(df: pd.DataFrame) -> dict:
         """Extract detailed insights for AI analysis"""
+        context = AnalysisContext.for_frame(df)
         insights = {
             'market_overview': {
                 'total_jobs': len(df),
                 'unique_companies': df['company'].nunique(),
                 'locations': df['location'].nunique(),
-                'avg_tech_per_job': df['tech_stack'].str.count(',').mean() + 1
+                'avg_tech_per_job': context.techs_per_job.mean()
             },
             'tech_trends': {
-                'top_technologies': Counter(
-                    tech.strip() 
-                    for techs in df['tech_stack'].str.split(',') 
-                    for tech in techs
-                ).most_common(15),
-                'emerging_tech': [
-                    tech for tech, count in Counter(
-                        tech.strip() 
-                        for techs in df['tech_stack'].str.split(',') 
-                        for tech in techs
-                    ).items() 
-                    if count <= 3
-                ]
+                'top_technologies': list(context.tech_counts.head(15).items()),
+                'emerging_tech': context.tech_counts[context.tech_counts <= 3].index.tolist()
             },
             'location_insights': {
-                'top_cities': df['city'].value_counts().head(10).to_dict(),
+                'top_cities': context.cities.value_counts().head(10).to_dict(),
                 'remote_jobs': len(df[df['location'].str.contains('Remote', case=False)])
             },
             'company_insights': {
@@ -231,29 +274,23 @@ class DataProcessor:
 
     @staticmethod
     def get_summary_stats(df: pd.DataFrame) -> dict:
+        context = AnalysisContext.for_frame(df)
         return {
             'total_jobs': len(df),
             'unique_companies': df['company'].nunique(),
-            'unique_cities': df['city'].nunique(),
-            'top_technologies': Counter([tech for techs in df['technologies'] for tech in techs]).most_common(5),
-            'avg_tech_per_job': sum(len(techs) for techs in df['technologies']) / len(df)
+            'unique_cities': context.cities.nunique(),
+            'top_technologies': list(context.tech_counts.head(5).items()),
+            'avg_tech_per_job': context.techs_per_job.mean()
         }
 
     @staticmethod
     def analyze_tech_combinations(df: pd.DataFrame) -> pd.DataFrame:
         """Analyze which technologies are commonly used together"""
-        tech_combinations = []
-        for techs in df['technologies']:
-            if len(techs) > 1:
-                for i in range(len(techs)):
-                    for j in range(i+1, len(techs)):
-                        tech_combinations.append(tuple(sorted([techs[i], techs[j]])))
-        
-        combo_df = pd.DataFrame(
-            pd.Series(tech_combinations).value_counts().head(20)
-        ).reset_index()
-        combo_df.columns = ['Technology Pair', 'Count']
-        return combo_df
+        top_pairs = AnalysisContext.for_frame(df).pair_counts.head(20)
+        return pd.DataFrame({
+            'Technology Pair': list(top_pairs.index),
+            'Count': top_pairs.values
+        })
 
     @staticmethod
     def analyze_time_trends(df: pd.DataFrame) -> dict:
@@ -261,11 +298,9 @@ class DataProcessor:
         if 'date_posted' not in df.columns:
             return {}
         
-        df['date_posted'] = pd.to_datetime(df['date_posted'])
-        daily_posts = df.groupby('date_posted').size()
-        tech_trends = df.groupby('date_posted')['technologies'].agg(
-            lambda x: len([item for sublist in x for item in sublist])
-        )
+        dates = pd.to_datetime(df['date_posted'])
+        daily_posts = df.groupby(dates).size()
+        tech_trends = AnalysisContext.for_frame(df).techs_per_job.groupby(dates).sum()
         
         return {
             'daily_posts': daily_posts,
@@ -275,19 +310,12 @@ class DataProcessor:
     @staticmethod
     def create_tech_network(df: pd.DataFrame) -> dict:
         """Create network data for technology relationships"""
-        tech_links = []
-        for techs in df['technologies']:
-            if len(techs) > 1:
-                for i in range(len(techs)):
-                    for j in range(i+1, len(techs)):
-                        tech_links.append((techs[i], techs[j]))
-        
+        context = AnalysisContext.for_frame(df)
+
         # Convert to network format
-        nodes = list(set([tech for techs in df['technologies'] for tech in techs]))
-        edges = pd.DataFrame(tech_links, columns=['source', 'target'])
-        edges['value'] = 1
-        edges = edges.groupby(['source', 'target'])['value'].sum().reset_index()
-        
+        nodes = list(context.tech_counts.index)
+        edges = context.pair_counts.rename('value').rename_axis(['source', 'target']).reset_index()
+
         return {
             'nodes': nodes,
             'edges': edges.to_dict('records')
@@ -301,37 +329,38 @@ class DataProcessor:
         return insights
 
     @staticmethod
-    def create_improved_tech_city_viz(df: pd.DataFrame) -> go.Figure:
-        """Create a better visualization for technology distribution by city"""
-        # Create a matrix of technologies per city
-        tech_city_matrix = {}
-        for _, row in df.iterrows():
-            city = row['city']
-            if city not in tech_city_matrix:
-                tech_city_matrix[city] = {}
-            
-            for tech in row['technologies']:
-                tech_city_matrix[city][tech] = tech_city_matrix[city].get(tech, 0) + 1
-        
-        # Convert to heatmap data
-        cities = list(tech_city_matrix.keys())
-        all_techs = set()
-        for city_data in tech_city_matrix.values():
-            all_techs.update(city_data.keys())
-        techs = sorted(list(all_techs))
+    def create_improved_tech_city_viz(df: pd.DataFrame, top_techs: int = 30, top_cities: int = 20) -> go.Figure:
+        """Create a better visualization for technology distribution by city
+
+        Only the `top_techs` technologies and `top_cities` cities with the most
+        mentions are plotted; pass None to keep all of them.
+        """
+        # Create a matrix of technologies per city from the exploded (job, tech) rows
+        context = AnalysisContext.for_frame(df)
+        mentions = context.technologies
+        job_cities = context.cities.to_numpy()[mentions.index.to_numpy()]
+        city_codes, city_names = pd.factorize(job_cities)
+        tech_codes, tech_names = pd.factorize(mentions.to_numpy())
+        located = city_codes >= 0
+        # One bincount over (city, tech) cell numbers; pd.crosstab falls back to a per-group Python loop
+        counts = np.bincount(
+            city_codes[located] * len(tech_names) + tech_codes[located],
+            minlength=len(city_names) * len(tech_names)
+        ).reshape(len(city_names), len(tech_names))
+        tech_city_matrix = pd.DataFrame(counts, index=city_names, columns=tech_names)
         
-        z_data = []
-        for city in cities:
-            row = []
-            for tech in techs:
-                row.append(tech_city_matrix[city].get(tech, 0))
-            z_data.append(row)
+        # Keep the busiest cities (most mentions first) and technologies (alphabetical)
+        city_totals = tech_city_matrix.sum(axis=1).sort_values(ascending=False, kind='stable')
+        tech_totals = tech_city_matrix.sum(axis=0).sort_values(ascending=False, kind='stable')
+        cities = city_totals.index[:top_cities]
+        techs = tech_totals.index[:top_techs].sort_values()
+        tech_city_matrix = tech_city_matrix.loc[cities, techs]
         
         # Create heatmap
         fig = go.Figure(data=go.Heatmap(
-            z=z_data,
-            x=techs,
-            y=cities,
+            z=tech_city_matrix.to_numpy(),
+            x=list(techs),
+            y=list(cities),
             colorscale='Viridis'
         ))
         
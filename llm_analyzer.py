@@ -3,6 +3,7 @@ from groq import Groq
 from dotenv import load_dotenv
 import pandas as pd
 import json
+from src.utils.analysis_context import AnalysisContext
 
 load_dotenv()
 
@@ -23,15 +24,9 @@ class DataProcessor:
     @staticmethod
     def _analyze_skill_combinations(df: pd.DataFrame) -> dict:
         # Analyze common skill combinations
-        skill_pairs = []
-        for tech_list in df['technologies']:
-            if len(tech_list) > 1:
-                for i in range(len(tech_list)):
-                    for j in range(i+1, len(tech_list)):
-                        # Convert tuple to string to use as dictionary key
-                        skill_pairs.append(f"{tech_list[i]} + {tech_list[j]}")
-        
-        skill_pair_counts = pd.Series(skill_pairs).value_counts().head(10).to_dict()
+        top_pairs = AnalysisContext.for_frame(df).pair_counts.head(10)
+        # Convert tuple to string to use as dictionary key
+        skill_pair_counts = {f"{a} + {b}": int(count) for (a, b), count in top_pairs.items()}
         return {'common_pairs': skill_pair_counts}
     
     @staticmethod
@@ -44,7 +39,7 @@ class DataProcessor:
     @staticmethod
     def _analyze_locations(df: pd.DataFrame) -> dict:
         return {
-            'city_distribution': df['location'].str.split(',').str[0].value_counts().to_dict(),
+            'city_distribution': AnalysisContext.for_frame(df).cities.value_counts().to_dict(),
             'remote_jobs': len(df[df['location'].str.contains('remote', case=False, na=False)])
         }
 
@@ -1,7 +1,16 @@
+import argparse
 import yaml
 import logging.config
 import os
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from src.scrapers.linkedin_scraper import LinkedInScraper
+from src.scrapers.async_scraper import AsyncLinkedInScraper
+from src.scrapers.crawl_scheduler import CrawlScheduler
+from src.scrapers.crawl_worker import CrawlWorker, run_worker, export_results
+from src.utils.task_queue import create_task_queue
+from src.utils.description_store import DescriptionStore
+from src.utils.html_parser import extract_tech_stacks
 
 def load_config():
     config_path = os.path.join('config', 'config.yaml')
@@ -16,14 +25,121 @@ def load_config():
 
     return config
 
+def create_scraper(config):
+    """Pick the scraping engine from scraper.engine (sync or async)."""
+    if config['scraper'].get('engine', 'sync') == 'async':
+        return AsyncLinkedInScraper(config)
+    return LinkedInScraper(config)
+
+def retag_csv(path, config, processes=None):
+    """Recompute the tech stack column of a CSV from its descriptions."""
+    df = pd.read_csv(path)
+    description_column = next((col for col in ('job_description', 'Job Description') if col in df.columns), None)
+    if description_column is None:
+        raise SystemExit(f"❌ {path} has no job_description column to re-tag from")
+    tech_column = next((col for col in ('tech_stack', 'Tech Stack') if col in df.columns), 'tech_stack')
+    descriptions = df[description_column]
+    job_keys = descriptions.map(DescriptionStore.parse_link)
+    linked = job_keys.notna()
+    missing = pd.Series(False, index=df.index)
+    if linked.any():
+        # Scraped rows link into the description store instead of carrying the text
+        store_path = DescriptionStore.config_path(config)
+        if not os.path.exists(store_path):
+            raise SystemExit(f"❌ {path} links {linked.sum()} descriptions to {store_path}, which does not exist")
+        store = DescriptionStore.from_config(config)
+        try:
+            stored = store.get_many(job_keys[linked].unique().tolist())
+        finally:
+            store.close()
+        descriptions = job_keys.map(stored).where(linked, descriptions)
+        missing = linked & descriptions.isna()
+        if missing.any():
+            print(f"⚠️ {missing.sum()} descriptions are not in {store_path}; their tech stacks are kept")
+    retagged = extract_tech_stacks(descriptions[~missing], processes=processes).reindex(df.index)
+    if tech_column in df.columns:
+        df[tech_column] = retagged.where(~missing, df[tech_column])
+    else:
+        df[tech_column] = retagged.fillna('Not specified')
+    df.to_csv(path, index=False)
+    print(f"🏷️ Re-tagged {len(df)} jobs in {path}")
+
+def enqueue_sweep(config):
+    """Seed the distributed queue with every search of the sweep."""
+    task_queue = create_task_queue(config)
+    try:
+        queued = CrawlWorker.enqueue_searches(task_queue, CrawlScheduler.build_queries(config))
+    finally:
+        task_queue.close()
+    print(f"📥 Queued {queued} searches")
+
+def run_workers(config, processes=None):
+    """Run local worker processes until the queue is drained, then export the results."""
+    processes = processes or config.get('distributed', {}).get('workers', 1)
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        processed_jobs = sum(pool.map(run_worker, [config] * processes))
+    print(f"\n✅ Workers finished. Jobs stored by this node: {processed_jobs}")
+    export_queue_results(config)
+
+def export_queue_results(config):
+    task_queue = create_task_queue(config)
+    try:
+        export_results(task_queue, config)
+    finally:
+        task_queue.close()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scrape LinkedIn job listings")
+    parser.add_argument('--retry-failed', action='store_true',
+                        help="re-fetch jobs and pages recorded in the dead-letter file")
+    parser.add_argument('--resume', action='store_true',
+                        help="continue an interrupted run, appending to the existing output")
+    parser.add_argument('--new-only', action='store_true',
+                        help="fetch only postings missing from the job index, newest first, appending to the output")
+    parser.add_argument('--sweep', action='store_true',
+                        help="search every search.keywords x city combination instead of one query")
+    parser.add_argument('--enqueue', action='store_true',
+                        help="seed the distributed queue with the --sweep searches")
+    parser.add_argument('--worker', action='store_true',
+                        help="run queue workers on this node until the queue is drained")
+    parser.add_argument('--export', action='store_true',
+                        help="write the distributed result store to the output CSV")
+    parser.add_argument('--retag', metavar='CSV',
+                        help="recompute tech stacks for an existing CSV after a taxonomy change")
+    parser.add_argument('--processes', type=int, default=None,
+                        help="worker processes for --retag and --worker")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
     config = load_config()
     logger = logging.getLogger('linkedin_scraper')
+
+    if args.retag:
+        retag_csv(args.retag, config, args.processes)
+        return
     
     try:
-        scraper = LinkedInScraper(config)
-        # Change "Data Engineer" to your desired search term
-        scraper.scrape_jobs("Data Engineer")
+        if args.enqueue:
+            enqueue_sweep(config)
+            return
+        if args.worker:
+            run_workers(config, args.processes)
+            return
+        if args.export:
+            export_queue_results(config)
+            return
+        scraper = create_scraper(config)
+        try:
+            if args.retry_failed:
+                scraper.retry_failed()
+            elif args.sweep:
+                CrawlScheduler(scraper, config).run(resume=args.resume, new_only=args.new_only)
+            else:
+                # Change "Data Engineer" to your desired search term
+                scraper.scrape_jobs("Data Engineer", resume=args.resume, new_only=args.new_only)
+        finally:
+            scraper.close()
     except Exception as e:
         logger.error(f"Error during scraping: {e}")
 
@@ -1,33 +1,7 @@
-TECH_KEYWORDS = [
-    'Python', 'Java', 'Scala', 'SQL', 'C#', 'Spark', 'Pyspark', 'Flink', 'Databricks', 'Fabric', 'Microsoft Fabric', 'kafka'
-    'Shell Scripting', 'Bash', 'TypeScript', 'JavaScript', 'Perl', 'Apache Flink', 'Hive', 'HBase', 'Apache Beam', 
-    'Storm', 'Druid', 'Apache Samza', 'Kylin', 'Impala', 'Presto', 'Trino', 'ClickHouse', 'XGBoost', 'LightGBM', 
-    'CatBoost', 'Scikit-Learn', 'Keras', 'Hugging Face Transformers', 'spaCy', 'NLTK', 'Dask-ML', 'OpenCV', 'FastAI', 
-    'Turi Create', 'MLflow', 'Kubeflow', 'Feast', 'Tecton', 'Seldon', 'BentoML', 'TFX', 'SageMaker Pipelines', 
-    'Vertex AI Pipelines', 'Azure ML Pipelines', 'Ray', 'Dask', 'ONNX', 'OpenAI API', 'LangChain', 'LLamaIndex', 
-    'DeepSpeed', 'Stable Diffusion', 'Whisper AI', 'Hugging Face Models', 'Meta Llama', 'Anthropic Claude', 
-    'Google Gemini AI', 'Mistral AI', 'GPT-4', 'GPT-3.5', 'LoRA', 'RLHF', 'AWS S3', 'AWS Glue', 'AWS Athena', 
-    'AWS Redshift', 'AWS RDS', 'AWS DynamoDB', 'AWS EMR', 'AWS Lambda', 'AWS Step Functions', 'AWS SageMaker', 
-    'AWS Kinesis', 'AWS Lake Formation', 'AWS Data Pipeline', 'AWS EventBridge', 'AWS OpenSearch', 'AWS DataSync', 
-    'Azure Data Factory', 'Azure Synapse', 'Azure Databricks', 'Azure Data Lake', 'Azure SQL Database', 'Azure Cosmos DB',
-    'Azure ML', 'Azure Functions', 'Azure Logic Apps', 'Azure HDInsight', 'Azure Event Hub', 'Azure Storage', 
-    'Azure Purview', 'Azure DevOps', 'Azure Stream Analytics', 'BigQuery', 'Cloud Storage', 'Cloud Composer (Apache Airflow)', 
-    'Google Pub/Sub', 'Google Cloud Functions', 'Google AI Platform', 'Vertex AI', 'Google DataFlow', 'Google Dataproc', 
-    'Snowflake', 'BigQuery', 'Amazon Redshift', 'Azure Synapse', 'PostgreSQL', 'MySQL', 'Oracle', 'SQL Server', 'Teradata', 
-    'MongoDB', 'Cassandra', 'DynamoDB', 'CockroachDB', 'Elasticsearch', 'Greenplum', 'Vertica', 'Apache Airflow', 
-    'AWS Glue', 'DBT', 'Talend', 'Informatica', 'Matillion', 'SSIS', 'Fivetran', 'Stitch', 'Pentaho', 'Apache NiFi', 
-    'StreamSets', 'Apache Kafka', 'RabbitMQ', 'ActiveMQ', 'AWS Kinesis', 'Google Pub/Sub', 'Azure Event Hubs', 'Pulsar', 
-    'NATS', 'ZeroMQ', 'Delta Lake', 'Apache Iceberg', 'Hudi', 'MinIO', 'LakeFS', 'Apache Airflow', 'Prefect', 'Luigi', 
-    'Dagster', 'Oozie', 'Docker', 'Kubernetes', 'Terraform', 'Ansible', 'Jenkins', 'GitHub Actions', 'GitLab CI/CD', 
-    'Helm', 'HashiCorp Vault', 'OpenShift', 'ArgoCD', 'CloudFormation', 'Pulumi', 'Spinnaker', 'Tableau', 'Power BI', 
-    'Looker', 'Mode Analytics', 'Metabase', 'Qlik Sense', 'Neo4j', 'JanusGraph', 'ArangoDB', 'Amazon Neptune', 'OrientDB', 
-    'AWS IAM', 'GCP IAM', 'Azure AD', 'CyberArk', 'Okta', 'Apache Ranger', 'Collibra', 'Alation', 'Monte Carlo', 'Presto', 
-    'Trino', 'Dremio', 'ClickHouse', 'Apache Drill', 'Prometheus', 'Grafana', 'Elastic Stack (ELK)', 'Splunk', 'Datadog', 
-    'New Relic', 'OpenTelemetry', 'Jaeger', 'Data Modeling', 'ETL', 'ELT', 'Data Warehousing', 'Schema Design', 'Star Schema', 
-    'Snowflake Schema', 'Data Lake', 'Lakehouse', 'Dimensional Modeling', 'Streaming Data Processing', 'Batch Processing', 
-    'Data Governance', 'Data Quality', 'Data Lineage', 'Data Pipelines', 'Data Replication', 'Change Data Capture (CDC)',
-    'Columnar Storage', 'Partitioning', 'Clustering','MLOPS','Machine Learning', 'Distributed Systems', 'Parallel Computing'
-]
+from .tech_taxonomy import TECH_TAXONOMY
+
+# Canonical technology names; see tech_taxonomy for aliases and matching rules
+TECH_KEYWORDS = [term.name for term in TECH_TAXONOMY]
 
 INDIAN_CITIES = [
     'India', 'Bangalore', 'Mumbai', 'Delhi', 'Hyderabad', 
@@ -0,0 +1,298 @@
+from collections import namedtuple
+
+# name: canonical label used in tech_stack output
+# aliases: other spellings that map to the same technology
+# case_sensitive: for names that are also ordinary English words (Ray, Storm, ...)
+# word_boundary: only match when not embedded in a longer word (Java vs JavaScript)
+TechTerm = namedtuple('TechTerm', ['name', 'category', 'aliases', 'case_sensitive', 'word_boundary'],
+                      defaults=((), False, True))
+
+# One compiled surface form in TECH_INDEX
+TechPattern = namedtuple('TechPattern', ['name', 'text', 'case_sensitive', 'word_boundary'])
+
+TECH_TAXONOMY = [
+    # Languages
+    TechTerm('Python', 'Languages'),
+    TechTerm('Java', 'Languages'),
+    TechTerm('Scala', 'Languages'),
+    TechTerm('SQL', 'Languages'),
+    TechTerm('C#', 'Languages'),
+    TechTerm('Shell Scripting', 'Languages', ('Shell Script',)),
+    TechTerm('Bash', 'Languages'),
+    TechTerm('TypeScript', 'Languages'),
+    TechTerm('JavaScript', 'Languages'),
+    TechTerm('Perl', 'Languages'),
+
+    # Big data processing
+    TechTerm('Spark', 'Big Data Processing', ('Apache Spark',)),
+    TechTerm('PySpark', 'Big Data Processing'),
+    TechTerm('Apache Flink', 'Big Data Processing', ('Flink',)),
+    TechTerm('Databricks', 'Big Data Processing'),
+    TechTerm('Microsoft Fabric', 'Big Data Processing', ('MS Fabric',)),
+    TechTerm('Hive', 'Big Data Processing', ('Apache Hive',)),
+    TechTerm('HBase', 'Big Data Processing', ('Apache HBase',)),
+    TechTerm('Apache Beam', 'Big Data Processing'),
+    TechTerm('Storm', 'Big Data Processing', ('Apache Storm',), case_sensitive=True),
+    TechTerm('Druid', 'Big Data Processing', ('Apache Druid',)),
+    TechTerm('Apache Samza', 'Big Data Processing', ('Samza',)),
+    TechTerm('Kylin', 'Big Data Processing', ('Apache Kylin',)),
+    TechTerm('Impala', 'Big Data Processing', ('Apache Impala',)),
+    TechTerm('Dask', 'Big Data Processing'),
+
+    # Query engines
+    TechTerm('Presto', 'Query Engines', ('PrestoDB',)),
+    TechTerm('Trino', 'Query Engines'),
+    TechTerm('ClickHouse', 'Query Engines'),
+    TechTerm('Dremio', 'Query Engines'),
+    TechTerm('Apache Drill', 'Query Engines'),
+
+    # Machine learning libraries
+    TechTerm('XGBoost', 'ML Libraries'),
+    TechTerm('LightGBM', 'ML Libraries'),
+    TechTerm('CatBoost', 'ML Libraries'),
+    TechTerm('Scikit-Learn', 'ML Libraries', ('sklearn',)),
+    TechTerm('Keras', 'ML Libraries'),
+    TechTerm('Hugging Face Transformers', 'ML Libraries'),
+    TechTerm('spaCy', 'ML Libraries'),
+    TechTerm('NLTK', 'ML Libraries'),
+    TechTerm('Dask-ML', 'ML Libraries'),
+    TechTerm('OpenCV', 'ML Libraries'),
+    TechTerm('FastAI', 'ML Libraries'),
+    TechTerm('Turi Create', 'ML Libraries'),
+
+    # MLOps
+    TechTerm('MLOps', 'MLOps'),
+    TechTerm('MLflow', 'MLOps'),
+    TechTerm('Kubeflow', 'MLOps'),
+    TechTerm('Feast', 'MLOps', case_sensitive=True),
+    TechTerm('Tecton', 'MLOps'),
+    TechTerm('Seldon', 'MLOps'),
+    TechTerm('BentoML', 'MLOps'),
+    TechTerm('TFX', 'MLOps'),
+    TechTerm('SageMaker Pipelines', 'MLOps'),
+    TechTerm('Vertex AI Pipelines', 'MLOps'),
+    TechTerm('Azure ML Pipelines', 'MLOps'),
+    TechTerm('Ray', 'MLOps', case_sensitive=True),
+    TechTerm('ONNX', 'MLOps'),
+
+    # Generative AI and LLMs
+    TechTerm('OpenAI API', 'GenAI & LLMs'),
+    TechTerm('LangChain', 'GenAI & LLMs'),
+    TechTerm('LlamaIndex', 'GenAI & LLMs'),
+    TechTerm('DeepSpeed', 'GenAI & LLMs'),
+    TechTerm('Stable Diffusion', 'GenAI & LLMs'),
+    TechTerm('Whisper AI', 'GenAI & LLMs'),
+    TechTerm('Hugging Face Models', 'GenAI & LLMs'),
+    TechTerm('Meta Llama', 'GenAI & LLMs'),
+    TechTerm('Anthropic Claude', 'GenAI & LLMs'),
+    TechTerm('Google Gemini AI', 'GenAI & LLMs'),
+    TechTerm('Mistral AI', 'GenAI & LLMs'),
+    TechTerm('GPT-4', 'GenAI & LLMs'),
+    TechTerm('GPT-3.5', 'GenAI & LLMs'),
+    TechTerm('LoRA', 'GenAI & LLMs', case_sensitive=True),
+    TechTerm('RLHF', 'GenAI & LLMs'),
+
+    # AWS
+    TechTerm('AWS S3', 'Cloud - AWS', ('Amazon S3',)),
+    TechTerm('AWS Glue', 'Cloud - AWS'),
+    TechTerm('AWS Athena', 'Cloud - AWS', ('Amazon Athena',)),
+    TechTerm('AWS Redshift', 'Cloud - AWS', ('Amazon Redshift', 'Redshift')),
+    TechTerm('AWS RDS', 'Cloud - AWS', ('Amazon RDS',)),
+    TechTerm('AWS DynamoDB', 'Cloud - AWS', ('Amazon DynamoDB', 'DynamoDB')),
+    TechTerm('AWS EMR', 'Cloud - AWS', ('Amazon EMR',)),
+    TechTerm('AWS Lambda', 'Cloud - AWS'),
+    TechTerm('AWS Step Functions', 'Cloud - AWS'),
+    TechTerm('AWS SageMaker', 'Cloud - AWS', ('Amazon SageMaker',)),
+    TechTerm('AWS Kinesis', 'Cloud - AWS', ('Amazon Kinesis', 'Kinesis')),
+    TechTerm('AWS Lake Formation', 'Cloud - AWS'),
+    TechTerm('AWS Data Pipeline', 'Cloud - AWS'),
+    TechTerm('AWS EventBridge', 'Cloud - AWS', ('Amazon EventBridge',)),
+    TechTerm('AWS OpenSearch', 'Cloud - AWS', ('Amazon OpenSearch',)),
+    TechTerm('AWS DataSync', 'Cloud - AWS'),
+    TechTerm('AWS IAM', 'Cloud - AWS'),
+
+    # Azure
+    TechTerm('Azure Data Factory', 'Cloud - Azure'),
+    TechTerm('Azure Synapse', 'Cloud - Azure', ('Synapse Analytics',)),
+    TechTerm('Azure Databricks', 'Cloud - Azure'),
+    TechTerm('Azure Data Lake', 'Cloud - Azure', ('ADLS',)),
+    TechTerm('Azure SQL Database', 'Cloud - Azure', ('Azure SQL DB',)),
+    TechTerm('Azure Cosmos DB', 'Cloud - Azure', ('Cosmos DB',)),
+    TechTerm('Azure ML', 'Cloud - Azure', ('Azure Machine Learning',)),
+    TechTerm('Azure Functions', 'Cloud - Azure'),
+    TechTerm('Azure Logic Apps', 'Cloud - Azure'),
+    TechTerm('Azure HDInsight', 'Cloud - Azure', ('HDInsight',)),
+    TechTerm('Azure Event Hubs', 'Cloud - Azure', ('Azure Event Hub',)),
+    TechTerm('Azure Storage', 'Cloud - Azure', ('Azure Blob Storage',)),
+    TechTerm('Azure Purview', 'Cloud - Azure', ('Microsoft Purview',)),
+    TechTerm('Azure DevOps', 'Cloud - Azure'),
+    TechTerm('Azure Stream Analytics', 'Cloud - Azure'),
+    TechTerm('Azure AD', 'Cloud - Azure', ('Azure Active Directory',)),
+
+    # Google Cloud
+    TechTerm('BigQuery', 'Cloud - GCP'),
+    TechTerm('Google Cloud Storage', 'Cloud - GCP'),
+    TechTerm('Cloud Composer', 'Cloud - GCP'),
+    TechTerm('Google Pub/Sub', 'Cloud - GCP', ('Pub/Sub',)),
+    TechTerm('Google Cloud Functions', 'Cloud - GCP'),
+    TechTerm('Google AI Platform', 'Cloud - GCP'),
+    TechTerm('Vertex AI', 'Cloud - GCP'),
+    TechTerm('Google DataFlow', 'Cloud - GCP', ('Cloud Dataflow',)),
+    TechTerm('Google Dataproc', 'Cloud - GCP', ('Dataproc',)),
+    TechTerm('GCP IAM', 'Cloud - GCP'),
+
+    # Warehouses and databases
+    TechTerm('Snowflake', 'Databases & Warehouses'),
+    TechTerm('PostgreSQL', 'Databases & Warehouses', ('Postgres',)),
+    TechTerm('MySQL', 'Databases & Warehouses'),
+    TechTerm('Oracle', 'Databases & Warehouses'),
+    TechTerm('SQL Server', 'Databases & Warehouses', ('MSSQL',)),
+    TechTerm('Teradata', 'Databases & Warehouses'),
+    TechTerm('MongoDB', 'Databases & Warehouses'),
+    TechTerm('Cassandra', 'Databases & Warehouses', ('Apache Cassandra',)),
+    TechTerm('CockroachDB', 'Databases & Warehouses'),
+    TechTerm('Elasticsearch', 'Databases & Warehouses'),
+    TechTerm('Greenplum', 'Databases & Warehouses'),
+    TechTerm('Vertica', 'Databases & Warehouses'),
+
+    # Graph databases
+    TechTerm('Neo4j', 'Graph Databases'),
+    TechTerm('JanusGraph', 'Graph Databases'),
+    TechTerm('ArangoDB', 'Graph Databases'),
+    TechTerm('Amazon Neptune', 'Graph Databases'),
+    TechTerm('OrientDB', 'Graph Databases'),
+
+    # ETL and integration
+    TechTerm('DBT', 'ETL & Integration', ('data build tool',)),
+    TechTerm('Talend', 'ETL & Integration'),
+    TechTerm('Informatica', 'ETL & Integration'),
+    TechTerm('Matillion', 'ETL & Integration'),
+    TechTerm('SSIS', 'ETL & Integration'),
+    TechTerm('Fivetran', 'ETL & Integration'),
+    TechTerm('Stitch', 'ETL & Integration', case_sensitive=True),
+    TechTerm('Pentaho', 'ETL & Integration'),
+    TechTerm('Apache NiFi', 'ETL & Integration', ('NiFi',)),
+    TechTerm('StreamSets', 'ETL & Integration'),
+
+    # Streaming and messaging
+    TechTerm('Apache Kafka', 'Streaming & Messaging', ('Kafka',)),
+    TechTerm('RabbitMQ', 'Streaming & Messaging'),
+    TechTerm('ActiveMQ', 'Streaming & Messaging'),
+    TechTerm('Pulsar', 'Streaming & Messaging', ('Apache Pulsar',), case_sensitive=True),
+    TechTerm('NATS', 'Streaming & Messaging', case_sensitive=True),
+    TechTerm('ZeroMQ', 'Streaming & Messaging'),
+
+    # Table formats and lake storage
+    TechTerm('Delta Lake', 'Lake Storage'),
+    TechTerm('Apache Iceberg', 'Lake Storage', ('Iceberg',)),
+    TechTerm('Hudi', 'Lake Storage', ('Apache Hudi',)),
+    TechTerm('MinIO', 'Lake Storage'),
+    TechTerm('LakeFS', 'Lake Storage'),
+
+    # Orchestration
+    TechTerm('Apache Airflow', 'Orchestration', ('Airflow',)),
+    TechTerm('Prefect', 'Orchestration', case_sensitive=True),
+    TechTerm('Luigi', 'Orchestration'),
+    TechTerm('Dagster', 'Orchestration'),
+    TechTerm('Oozie', 'Orchestration', ('Apache Oozie',)),
+
+    # DevOps and infrastructure as code
+    TechTerm('Docker', 'DevOps & IaC'),
+    TechTerm('Kubernetes', 'DevOps & IaC', ('K8s',)),
+    TechTerm('Terraform', 'DevOps & IaC'),
+    TechTerm('Ansible', 'DevOps & IaC'),
+    TechTerm('Jenkins', 'DevOps & IaC'),
+    TechTerm('GitHub Actions', 'DevOps & IaC'),
+    TechTerm('GitLab CI/CD', 'DevOps & IaC', ('GitLab CI',)),
+    TechTerm('Helm', 'DevOps & IaC', case_sensitive=True),
+    TechTerm('HashiCorp Vault', 'DevOps & IaC'),
+    TechTerm('OpenShift', 'DevOps & IaC'),
+    TechTerm('ArgoCD', 'DevOps & IaC', ('Argo CD',)),
+    TechTerm('CloudFormation', 'DevOps & IaC'),
+    TechTerm('Pulumi', 'DevOps & IaC'),
+    TechTerm('Spinnaker', 'DevOps & IaC'),
+
+    # BI and visualization
+    TechTerm('Tableau', 'BI & Visualization'),
+    TechTerm('Power BI', 'BI & Visualization'),
+    TechTerm('Looker', 'BI & Visualization'),
+    TechTerm('Mode Analytics', 'BI & Visualization'),
+    TechTerm('Metabase', 'BI & Visualization'),
+    TechTerm('Qlik Sense', 'BI & Visualization'),
+
+    # Security and governance
+    TechTerm('CyberArk', 'Security & Governance'),
+    TechTerm('Okta', 'Security & Governance'),
+    TechTerm('Apache Ranger', 'Security & Governance'),
+    TechTerm('Collibra', 'Security & Governance'),
+    TechTerm('Alation', 'Security & Governance'),
+    TechTerm('Monte Carlo', 'Security & Governance', case_sensitive=True),
+
+    # Observability
+    TechTerm('Prometheus', 'Observability'),
+    TechTerm('Grafana', 'Observability'),
+    TechTerm('ELK Stack', 'Observability', ('Elastic Stack', 'ELK')),
+    TechTerm('Splunk', 'Observability'),
+    TechTerm('Datadog', 'Observability'),
+    TechTerm('New Relic', 'Observability'),
+    TechTerm('OpenTelemetry', 'Observability'),
+    TechTerm('Jaeger', 'Observability'),
+
+    # Concepts and practices
+    TechTerm('Data Modeling', 'Concepts', ('Data Modelling',)),
+    TechTerm('ETL', 'Concepts'),
+    TechTerm('ELT', 'Concepts', case_sensitive=True),
+    TechTerm('Data Warehousing', 'Concepts', ('Data Warehouse',)),
+    TechTerm('Schema Design', 'Concepts'),
+    TechTerm('Star Schema', 'Concepts'),
+    TechTerm('Snowflake Schema', 'Concepts'),
+    TechTerm('Data Lake', 'Concepts'),
+    TechTerm('Lakehouse', 'Concepts'),
+    TechTerm('Dimensional Modeling', 'Concepts', ('Dimensional Modelling',)),
+    TechTerm('Streaming Data Processing', 'Concepts'),
+    TechTerm('Batch Processing', 'Concepts'),
+    TechTerm('Data Governance', 'Concepts'),
+    TechTerm('Data Quality', 'Concepts'),
+    TechTerm('Data Lineage', 'Concepts'),
+    TechTerm('Data Pipelines', 'Concepts', ('Data Pipeline',)),
+    TechTerm('Data Replication', 'Concepts'),
+    TechTerm('Change Data Capture', 'Concepts', ('CDC',)),
+    TechTerm('Columnar Storage', 'Concepts'),
+    TechTerm('Partitioning', 'Concepts'),
+    TechTerm('Clustering', 'Concepts'),
+    TechTerm('Machine Learning', 'Concepts'),
+    TechTerm('Distributed Systems', 'Concepts'),
+    TechTerm('Parallel Computing', 'Concepts'),
+]
+
+def _surface_forms(text: str) -> set:
+    """Spelling variants matched for one name or alias (Power BI -> PowerBI, Scikit-Learn -> Scikit Learn)."""
+    return {
+        text,
+        text.replace(' ', ''),
+        text.replace(' ', '-'),
+        text.replace('-', ''),
+        text.replace('-', ' '),
+        text.replace('.', '')
+    }
+
+def build_tech_index(taxonomy) -> dict:
+    """Compile a taxonomy into a pattern -> TechPattern lookup, rejecting ambiguous aliases."""
+    index = {}
+    names = set()
+    for term in taxonomy:
+        if term.name in names:
+            raise ValueError(f"Duplicate technology in taxonomy: {term.name}")
+        names.add(term.name)
+        for alias in (term.name,) + tuple(term.aliases):
+            for form in _surface_forms(alias):
+                key = form if term.case_sensitive else form.lower()
+                pattern = TechPattern(term.name, form, term.case_sensitive, term.word_boundary)
+                existing = index.get(key)
+                if existing and existing.name != term.name:
+                    raise ValueError(f"Alias '{form}' maps to both {existing.name} and {term.name}")
+                index[key] = pattern
+    return index
+
+TECH_INDEX = build_tech_index(TECH_TAXONOMY)
+TECH_CATEGORIES = {term.name: term.category for term in TECH_TAXONOMY}
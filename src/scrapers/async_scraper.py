@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+from .linkedin_scraper import LinkedInScraper
+
+logger = logging.getLogger(__name__)
+
+class AsyncLinkedInScraper(LinkedInScraper):
+    """Pipelined engine: page fetching, description fetching and writing run as concurrent stages.
+
+    Stages are connected by bounded asyncio queues, so page N+1 is fetched
+    and parsed while the descriptions of page N are still in flight. Blocking
+    network calls go through the shared HttpClient in worker threads, which
+    keeps the rate limiter, retries and cache exactly as in the sync engine.
+    Rows are written in search-result order, with the same CSV schema.
+    """
+
+    def _scrape_query(self, keywords, location, writer):
+        query = self._query_key(keywords, location)
+        if self.checkpoint.is_query_done(query):
+            print(f"⏭️ Skipping completed search: {query}")
+            return 0
+        print(f"⚡ Using async engine with {self.max_concurrency} description workers")
+        return asyncio.run(self._scrape_query_async(keywords, location, writer))
+
+    async def _scrape_query_async(self, keywords, location, writer) -> int:
+        query = self._query_key(keywords, location)
+        page = self._start_page(query)
+        self._print_search(keywords, location, page)
+        # One thread per description worker plus one for the page producer
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=self.max_concurrency + 1))
+        queue_size = self.config['scraper'].get('queue_size', self.config['scraper']['jobs_per_page'])
+
+        job_queue = asyncio.Queue(maxsize=queue_size)
+        result_queue = asyncio.Queue(maxsize=queue_size)
+
+        workers = [
+            asyncio.create_task(self._description_worker(job_queue, result_queue))
+            for _ in range(self.max_concurrency)
+        ]
+        writer_task = asyncio.create_task(self._write_results(result_queue, writer, query))
+
+        last_seq = await self._produce_pages(keywords, location, page, job_queue, result_queue)
+        for _ in workers:
+            await job_queue.put(None)
+        await asyncio.gather(*workers)
+        await result_queue.put((last_seq, 'end', None))
+        return await writer_task
+
+    async def _produce_pages(self, keywords, location, page, job_queue, result_queue) -> int:
+        """Fetch and parse search pages, feeding jobs to the workers; return the next sequence number."""
+        jobs_per_page = self.config['scraper']['jobs_per_page']
+        pagination = self._new_pagination(jobs_per_page)
+        failed_pages = 0
+        seq = 0
+        while True:
+            print(f"\n📄 Processing page {page + 1}...")
+            params = self._build_search_params(keywords, location, page, jobs_per_page)
+            url = f"{self.config['scraper']['base_url']}?{urlencode(params)}"
+
+            search_page = await asyncio.to_thread(self._parse_page, url)
+            if search_page is None:
+                self.dead_letters.push('page', url, 'search page fetch failed')
+                failed_pages += 1
+                if failed_pages >= self.max_failed_pages:
+                    print(f"🛑 {failed_pages} pages in a row failed to load. Stopping.")
+                    return seq
+                page += 1
+                continue
+
+            failed_pages = 0
+            stop_reason = pagination.stop_reason(page, search_page)
+            if search_page.cards_found:
+                jobs = search_page.jobs
+                for i, job_data in enumerate(jobs, 1):
+                    await job_queue.put((seq, job_data, f"p{page + 1} {i}/{len(jobs)}"))
+                    seq += 1
+                # Page marker: the writer commits the checkpoint once every job before it is written
+                await result_queue.put((seq, 'page', params['start']))
+                seq += 1
+            if stop_reason:
+                print(f"🛑 {stop_reason}. Stopping.")
+                await result_queue.put((seq, 'done', None))
+                return seq + 1
+            page += 1
+
+    async def _description_worker(self, job_queue, result_queue):
+        while True:
+            item = await job_queue.get()
+            if item is None:
+                return
+            seq, job_data, label = item
+            description = await asyncio.to_thread(self.job_desc_scraper.get_description, job_data['job_link'])
+            await result_queue.put((seq, 'job', (job_data, description, label)))
+
+    async def _write_results(self, result_queue, writer, query) -> int:
+        """Write results in sequence order, committing the checkpoint at each page marker."""
+        pending = {}
+        next_seq = 0
+        processed_jobs = 0
+        while True:
+            seq, kind, payload = await result_queue.get()
+            pending[seq] = (kind, payload)
+            while next_seq in pending:
+                kind, payload = pending.pop(next_seq)
+                next_seq += 1
+                if kind == 'end':
+                    return processed_jobs
+                if kind == 'page':
+                    self._commit_page(writer, query, payload)
+                    print(f"⏳ Progress: Processed {processed_jobs} jobs so far...")
+                    continue
+                if kind == 'done':
+                    self.checkpoint.complete_query(query)
+                    continue
+                job_data, description, label = payload
+                if self._record_job(writer, job_data, description, label):
+                    processed_jobs += 1
@@ -0,0 +1,65 @@
+import logging
+import queue
+import threading
+from .linkedin_scraper import LinkedInScraper
+
+logger = logging.getLogger(__name__)
+
+class CrawlScheduler:
+    """Runs a keywords x cities search matrix as a work queue over one scraper.
+
+    Every search shares the scraper's HTTP client, so the per-host rate
+    limiter budgets all of them together, and its checkpoint, so a job
+    listed under several searches is fetched and written only once. Searches
+    that reached their last page are skipped when a sweep is resumed.
+    """
+
+    def __init__(self, scraper: LinkedInScraper, config: dict):
+        self.scraper = scraper
+        self.config = config
+        self.queries = self.build_queries(config)
+        self.parallel_queries = max(1, config.get('search', {}).get('parallel_queries', 1))
+
+    @staticmethod
+    def build_queries(config: dict) -> list:
+        """All (keywords, location) pairs from search.keywords and the configured cities."""
+        search_config = config.get('search', {})
+        keywords = search_config.get('keywords', ['Data Engineer'])
+        cities = search_config.get('cities') or config['locations']['india']['cities']
+        return [(keyword, city) for keyword in keywords for city in cities]
+
+    def run(self, resume: bool = False, new_only: bool = False) -> int:
+        print(f"\n🗺️ Starting sweep of {len(self.queries)} searches "
+              f"with {self.parallel_queries} running at a time")
+        append = self.scraper._prepare_checkpoint(resume, new_only)
+
+        work = queue.Queue()
+        for query in self.queries:
+            work.put(query)
+        totals = []
+
+        with self.scraper._open_output(append) as writer:
+            threads = [
+                threading.Thread(target=self._run_worker, args=(work, writer, totals), daemon=True)
+                for _ in range(min(self.parallel_queries, len(self.queries)))
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        processed_jobs = sum(totals)
+        self.scraper._print_summary(processed_jobs)
+        return processed_jobs
+
+    def _run_worker(self, work, writer, totals):
+        while True:
+            try:
+                keywords, location = work.get_nowait()
+            except queue.Empty:
+                return
+            print(f"\n🚀 Searching: {keywords} in {location}")
+            try:
+                totals.append(self.scraper._scrape_query(keywords, location, writer))
+            except Exception as e:
+                logger.error(f"Search {keywords} in {location} failed: {e}")
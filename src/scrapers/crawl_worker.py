@@ -0,0 +1,154 @@
+import logging
+import math
+import os
+import socket
+import time
+from urllib.parse import urlencode
+from ..utils.rate_limiter import RateLimiter
+from ..utils.task_queue import create_task_queue
+from ..utils.description_store import DescriptionStore
+from ..utils.output_sinks import create_sinks
+from .linkedin_scraper import LinkedInScraper
+
+logger = logging.getLogger(__name__)
+
+class CrawlWorker:
+    """Pulls search-page and job tasks from a shared queue until the crawl is drained.
+
+    A page task fetches one search page and enqueues a job task per card,
+    keyed by job ID so a posting listed under several searches is fetched
+    once across all workers, plus the task for the next page. A job task
+    fetches the description and stores the finished row in the queue's
+    result store. Requests draw from the queue's shared rate budget.
+    """
+
+    def __init__(self, config: dict, task_queue, worker_id: str = None):
+        self.config = config
+        self.queue = task_queue
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.poll_seconds = config.get('distributed', {}).get('poll_seconds', 2)
+        self.scraper = LinkedInScraper(config)
+        self.scraper.http_client.rate_limiter = RateLimiter.from_config(config, budget_store=task_queue)
+
+    @staticmethod
+    def enqueue_searches(task_queue, queries) -> int:
+        """Seed the queue with the first page of every (keywords, location) search."""
+        return sum(
+            task_queue.put('page', {'keywords': keywords, 'location': location, 'page': 0},
+                           key=f"page|{keywords}|{location}|0")
+            for keywords, location in queries
+        )
+
+    def run(self) -> int:
+        """Work until no task is pending or leased; return the number of jobs stored."""
+        print(f"\n👷 Worker {self.worker_id} started")
+        processed_jobs = 0
+        while True:
+            task = self.queue.lease(self.worker_id)
+            if task is None:
+                # Leased tasks can still fan out into new ones, so only stop once nothing is in flight
+                if not self.queue.counts().get('leased'):
+                    break
+                time.sleep(self.poll_seconds)
+                continue
+
+            try:
+                if task.kind == 'page':
+                    done = self._handle_page(task.payload)
+                else:
+                    done = self._handle_job(task.payload)
+            except Exception as e:
+                logger.error(f"Task {task.id} raised: {e}")
+                done = False
+
+            if done:
+                self.queue.ack(task)
+                processed_jobs += task.kind == 'job'
+            elif not self.queue.fail(task, 'fetch failed'):
+                self._dead_letter(task)
+
+        print(f"✅ Worker {self.worker_id} finished. Jobs stored: {processed_jobs}")
+        return processed_jobs
+
+    def _page_url(self, payload: dict) -> str:
+        params = self.scraper._build_search_params(
+            payload['keywords'], payload['location'], payload['page'], self.config['scraper']['jobs_per_page']
+        )
+        return f"{self.config['scraper']['base_url']}?{urlencode(params)}"
+
+    def _handle_page(self, payload: dict) -> bool:
+        print(f"\n📄 {payload['keywords']} in {payload['location']}: page {payload['page'] + 1}")
+        search_page = self.scraper._parse_page(self._page_url(payload))
+        if self.scraper.job_index is not None:
+            # No output owns the index here; an open touch would lock it against every other worker
+            self.scraper.job_index.flush()
+        if search_page is None:
+            return False
+        if not search_page.cards_found:
+            print("🛑 No more jobs found on this page. Search finished.")
+            return True
+
+        queued = sum(
+            self.queue.put('job', job_data, key=f"job|{job_data['job_id']}" if job_data['job_id'] else None)
+            for job_data in search_page.jobs
+        )
+        print(f"📊 Queued {queued} new jobs")
+
+        # The first page's result count caps the search, since pages past it only recycle cards
+        last_page = payload.get('last_page')
+        if last_page is None and search_page.total_results:
+            last_page = math.ceil(search_page.total_results / self.config['scraper']['jobs_per_page']) - 1
+        if last_page is not None and payload['page'] >= last_page:
+            print("🛑 Reached the last page of results. Search finished.")
+            return True
+
+        next_page = dict(payload, page=payload['page'] + 1, last_page=last_page)
+        self.queue.put('page', next_page,
+                       key=f"page|{payload['keywords']}|{payload['location']}|{next_page['page']}")
+        return True
+
+    def _handle_job(self, job_data: dict) -> bool:
+        description = self.scraper.job_desc_scraper.get_description(job_data['job_link'])
+        if description is None:
+            return False
+        result_key = job_data['job_id'] or job_data['job_link']
+        row = self.scraper._build_row(job_data, description)
+        # The task is acknowledged next, so the description must be committed first
+        self.scraper.description_store.flush()
+        self.queue.put_result(result_key, row)
+        print(f"  ✓ Processed: {job_data['job_title']} at {job_data['company']}")
+        return True
+
+    def _dead_letter(self, task):
+        if task.kind == 'page':
+            self.scraper.dead_letters.push('page', self._page_url(task.payload), 'search page fetch failed')
+        else:
+            self.scraper.dead_letters.push('job', task.payload['job_link'], 'description fetch failed',
+                                           job=task.payload)
+
+def run_worker(config: dict) -> int:
+    """Entry point for one worker process; each process opens its own queue connection."""
+    task_queue = create_task_queue(config)
+    worker = None
+    try:
+        worker = CrawlWorker(config, task_queue)
+        return worker.run()
+    finally:
+        if worker is not None:
+            worker.scraper.close()
+        task_queue.close()
+
+def export_results(task_queue, config: dict) -> int:
+    """Write every stored result row to the configured outputs."""
+    rows = 0
+    # The Parquet copy resolves description links through the store
+    description_store = DescriptionStore.from_config(config)
+    try:
+        with create_sinks(config, stores=[description_store]) as writer:
+            for row in task_queue.iter_results():
+                writer.writerow(row)
+                rows += 1
+    finally:
+        description_store.close()
+    print(f"💾 Exported {rows} jobs to {config['output']['file']}")
+    return rows
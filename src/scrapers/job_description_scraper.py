@@ -1,36 +1,62 @@
 import logging
-from bs4 import BeautifulSoup
-import requests
-import time
+from ..utils.html_parser import extract_job_id, parse_html, stream_section_text
 
 logger = logging.getLogger(__name__)
 
 class JobDescriptionScraper:
-    def __init__(self, headers):
-        self.headers = headers
+    NOT_AVAILABLE = "Description not available"
+
+    # Possible description containers, as CSS selectors and as (tag, class) pairs
+    DESCRIPTION_SELECTORS = [
+        'div.description__text',
+        'div.show-more-less-html__markup',
+        'div.job-description',
+        'section.description'
+    ]
+    DESCRIPTION_CONTAINERS = [tuple(selector.split('.')) for selector in DESCRIPTION_SELECTORS]
+
+    def __init__(self, client, cache=None, parser_backend: str = 'auto', streaming: bool = False):
+        self.client = client
+        self.cache = cache
+        self.parser_backend = parser_backend
+        self.streaming = streaming
         self.logger = logging.getLogger(__name__)
 
     def get_description(self, url: str) -> str:
+        """Return the job description text, or None if the page could not be fetched."""
+        job_id = extract_job_id(url)
+        if self.cache and job_id:
+            description = self.cache.get(job_id)
+            if description is not None:
+                return description
+
+        description = self._fetch_description(url)
+        if self.cache and job_id and description not in (None, self.NOT_AVAILABLE):
+            self.cache.put(job_id, description)
+        return description
+
+    def _fetch_description(self, url: str) -> str:
         try:
-            response = requests.get(url, headers=self.headers)
+            if self.streaming:
+                return self._stream_description(url)
+
+            response = self.client.get(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Try multiple possible description containers
-            description_selectors = [
-                'div.description__text',
-                'div.show-more-less-html__markup',
-                'div.job-description',
-                'section.description'
-            ]
-            
-            for selector in description_selectors:
-                desc_elem = soup.select_one(selector)
+            document = parse_html(response.text, self.parser_backend)
+
+            for selector in self.DESCRIPTION_SELECTORS:
+                desc_elem = document.select_one(selector)
                 if desc_elem:
-                    return desc_elem.get_text(strip=True, separator=' ')
+                    return desc_elem.text()
             
-            return "Description not available"
+            return self.NOT_AVAILABLE
             
         except Exception as e:
             self.logger.error(f"Error fetching job description: {e}")
-            return "Failed to fetch description"
+            return None
+
+    def _stream_description(self, url: str) -> str:
+        """Read the job page only up to the end of the description container."""
+        response = self.client.get(url, stream=True)
+        description = stream_section_text(response, self.DESCRIPTION_CONTAINERS)
+        return description if description is not None else self.NOT_AVAILABLE
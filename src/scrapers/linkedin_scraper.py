@@ -1,129 +1,348 @@
 import logging
-import time
-import csv
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple
 from urllib.parse import urlencode
-from ..utils.html_parser import create_soup_from_url, extract_tech_stack
+from ..utils.html_parser import (
+    fetch_document, extract_tech_stack, extract_job_id, extract_total_results, resolve_backend
+)
+from ..utils.http_client import HttpClient
+from ..utils.dead_letter import DeadLetterQueue
+from ..utils.checkpoint import CheckpointStore
+from ..utils.response_cache import DescriptionCache
+from ..utils.job_index import JobIndex
+from ..utils.description_store import DescriptionStore
+from ..utils.output_sinks import create_sinks
+from ..utils.keyword_matcher import KeywordMatcher
+from ..utils.pagination import PaginationTracker
 from .job_description_scraper import JobDescriptionScraper
-from ..constants.tech_keywords import TECH_KEYWORDS
+from ..constants.tech_taxonomy import TECH_INDEX
 
 logger = logging.getLogger(__name__)
 
+# One parsed search page: jobs not fetched yet, plus what pagination needs to know
+SearchPage = namedtuple('SearchPage', ['cards_found', 'jobs', 'total_results', 'card_ids', 'known_ids'])
+
 class LinkedInScraper:
     def __init__(self, config):
         self.config = config
-        self.job_desc_scraper = JobDescriptionScraper(config['scraper']['headers'])
+        self.http_client = HttpClient.from_config(config)
+        self.parser_backend = resolve_backend(config['scraper'].get('parser', 'auto'))
+        self.job_desc_scraper = JobDescriptionScraper(
+            self.http_client, DescriptionCache.from_config(config), self.parser_backend,
+            streaming=config['scraper'].get('stream_descriptions', False)
+        )
         self.logger = logging.getLogger(__name__)
-        self.tech_keywords = TECH_KEYWORDS  # Store tech keywords directly
-        self.desc_folder = 'job_descriptions'
-        os.makedirs(self.desc_folder, exist_ok=True)
+        self.tech_matcher = KeywordMatcher.from_index(TECH_INDEX)  # Built once, reused for every description
+        self.description_store = DescriptionStore.from_config(config)
+        self.max_concurrency = max(1, config['scraper'].get('max_concurrency', 1))
+        self.max_failed_pages = config['scraper'].get('retry', {}).get('max_failed_pages', 3)
+        self.dead_letters = DeadLetterQueue(config['output'].get('dead_letter_file', 'failed_jobs.jsonl'))
+        self.checkpoint = CheckpointStore(
+            config['output'].get('checkpoint_file', f"{config['output']['file']}.checkpoint")
+        )
+        self.job_index = JobIndex.from_config(config)
+        self.stop_after_known = config['scraper'].get('job_index', {}).get('stop_after_known', 25)
+        self.new_only = False
+        # Shared by concurrent searches: one CSV writer, one set of in-flight job IDs
+        self._write_lock = threading.Lock()
+        self._claim_lock = threading.Lock()
+        self._claimed_ids = set()
 
-    def scrape_jobs(self, keywords: str):
+    def scrape_jobs(self, keywords: str, resume: bool = False, location: str = 'India', new_only: bool = False):
         print(f"\n🚀 Starting LinkedIn job scraping for: {keywords}")
+        append = self._prepare_checkpoint(resume, new_only)
+
+        with self._open_output(append) as writer:
+            processed_jobs = self._scrape_query(keywords, location, writer)
+
+        self._print_summary(processed_jobs)
+
+    def _scrape_query(self, keywords, location, writer):
+        """Crawl every result page of one search; return the number of jobs written."""
         jobs_per_page = self.config['scraper']['jobs_per_page']
+        query = self._query_key(keywords, location)
+        if self.checkpoint.is_query_done(query):
+            print(f"⏭️ Skipping completed search: {query}")
+            return 0
+
+        page = self._start_page(query)
         processed_jobs = 0
-        page = 0
+        self._print_search(keywords, location, page)
 
-        print(f"🔍 Search parameters:")
-        print(f"    - Keywords: {keywords}")
-        print(f"    - Location: India")
-        with open(self.config['output']['file'], mode='w', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            writer.writerow(self.config['output']['columns'])
-
-            while True:
-                print(f"\n📄 Processing page {page + 1}...")
-                params = self._build_search_params(keywords, page, jobs_per_page)
-                url = f"{self.config['scraper']['base_url']}?{urlencode(params)}"
-                
-                jobs = self._process_page(url, writer)
-                if not jobs:
-                    print("🛑 No more jobs found on this page. Stopping.")
+        pagination = self._new_pagination(jobs_per_page)
+        failed_pages = 0
+        while True:
+            print(f"\n📄 Processing page {page + 1}...")
+            params = self._build_search_params(keywords, location, page, jobs_per_page)
+            url = f"{self.config['scraper']['base_url']}?{urlencode(params)}"
+            
+            result = self._process_page(url, writer)
+            if result is None:
+                # A page that failed after retries is skipped, not treated as the end
+                self.dead_letters.push('page', url, 'search page fetch failed')
+                failed_pages += 1
+                if failed_pages >= self.max_failed_pages:
+                    print(f"🛑 {failed_pages} pages in a row failed to load. Stopping.")
                     break
+                page += 1
+                continue
 
+            failed_pages = 0
+            search_page, jobs = result
+            stop_reason = pagination.stop_reason(page, search_page)
+            if search_page.cards_found:
+                self._commit_page(writer, query, params['start'])
                 processed_jobs += jobs
                 print(f"⏳ Progress: Processed {processed_jobs} jobs so far...")
-                page += 1
-                print(f"💤 Waiting {self.config['scraper']['delay']['between_pages']} seconds before next page...")
-                time.sleep(self.config['scraper']['delay']['between_pages'])
+            if stop_reason:
+                print(f"🛑 {stop_reason}. Stopping.")
+                self.checkpoint.complete_query(query)
+                break
+            page += 1
+
+        return processed_jobs
+
+    def _prepare_checkpoint(self, resume, new_only=False):
+        """Load the checkpoint when resuming, otherwise reset it; return True to append to the output."""
+        output_exists = os.path.exists(self.config['output']['file'])
+        resume = resume and output_exists
+        if resume:
+            self.checkpoint.load()
+            print(f"♻️ Resuming, skipping {len(self.checkpoint.seen_job_ids)} fetched jobs")
+        else:
+            self.checkpoint.reset()
+
+        self.new_only = new_only
+        if new_only:
+            if self.job_index is None:
+                raise ValueError("New-postings-only mode needs scraper.job_index.enabled")
+            print(f"🆕 New postings only: {len(self.job_index)} known jobs are skipped")
+            return resume or output_exists
+        return resume
 
+    def _new_pagination(self, jobs_per_page):
+        return PaginationTracker(jobs_per_page, self.stop_after_known if self.new_only else None)
+
+    def _start_page(self, query):
+        last_start = self.checkpoint.last_completed_start(query)
+        return 0 if last_start is None else last_start // self.config['scraper']['jobs_per_page'] + 1
+
+    @staticmethod
+    def _query_key(keywords, location):
+        return f"{keywords} | {location}"
+
+    @staticmethod
+    def _print_search(keywords, location, page):
+        print(f"🔍 Search parameters:")
+        print(f"    - Keywords: {keywords}")
+        print(f"    - Location: {location}")
+        if page:
+            print(f"    - Resuming at page: {page + 1}")
+
+    def _commit_page(self, writer, query=None, start=None):
+        # Rows must hit disk before the journal records them as done
+        with self._write_lock:
+            writer.flush()
+            self.checkpoint.commit(query, start)
+
+    def _open_output(self, append):
+        # The outputs only flush the stores; they stay open for the next output until close()
+        return create_sinks(self.config, append, stores=[self.description_store, self.job_index])
+
+    def close(self):
+        """Commit and close the description store and job index, then the cache and HTTP session."""
+        self.description_store.close()
+        if self.job_index is not None:
+            self.job_index.close()
+        if self.job_desc_scraper.cache is not None:
+            self.job_desc_scraper.cache.close()
+        self.http_client.close()
+
+    def _print_summary(self, processed_jobs):
         print(f"\n✅ Finished scraping. Total jobs processed: {processed_jobs}")
         print(f"💾 Results saved to: {self.config['output']['file']}")
+        if len(self.dead_letters):
+            print(f"⚠️ {len(self.dead_letters)} failed fetches saved to {self.dead_letters.path} (rerun with --retry-failed)")
         print("🎉 Scraping completed successfully!\n")
 
-    def _build_search_params(self, keywords, page, jobs_per_page):
-        return {
+    def retry_failed(self):
+        """Re-fetch everything in the dead-letter file and append it to the output."""
+        entries = self.dead_letters.drain()
+        if not entries:
+            print("✅ No failed fetches to retry")
+            return
+
+        print(f"\n🔁 Retrying {len(entries)} failed fetches...")
+        processed_jobs = 0
+        with self._open_output(append=True) as writer:
+            for entry in entries:
+                if entry['kind'] != 'page':
+                    continue
+                result = self._process_page(entry['url'], writer)
+                if result is None:
+                    self.dead_letters.push('page', entry['url'], 'search page fetch failed')
+                else:
+                    processed_jobs += result[1]
+
+            jobs = [entry['job'] for entry in entries if entry['kind'] == 'job']
+            processed_jobs += self._process_jobs(jobs, writer)
+            self._commit_page(writer)
+
+        print(f"\n✅ Recovered {processed_jobs} jobs, {len(self.dead_letters)} still failing")
+
+    def _build_search_params(self, keywords, location, page, jobs_per_page):
+        params = {
             'keywords': keywords,
-            'location': 'India',
-            'geoId': self.config['locations']['india']['geoId'],
+            'location': location,
             'start': page * jobs_per_page,
             'position': 1,
             'pageNum': page,
-            'f_WT': '2',
-            'locationId': 'OTHERS.india'
+            'f_WT': '2'
         }
+        if self.new_only:
+            # Newest first, so the crawl can stop once it reaches postings from earlier runs
+            params['sortBy'] = 'DD'
+        if location == 'India':
+            params['geoId'] = self.config['locations']['india']['geoId']
+            params['locationId'] = 'OTHERS.india'
+        else:
+            params['location'] = f"{location}, India"
+        return params
 
     def _process_page(self, url, writer):
-        soup = create_soup_from_url(url, self.config['scraper']['headers'])
-        if not soup:
+        """Return (SearchPage, jobs_processed), or None if the page could not be fetched."""
+        search_page = self._parse_page(url)
+        if search_page is None:
+            return None
+        return search_page, self._process_jobs(search_page.jobs, writer)
+
+    def _parse_page(self, url):
+        """Return the page's SearchPage, or None if the page could not be fetched."""
+        document = fetch_document(url, self.http_client, self.parser_backend)
+        if not document:
             print("❌ Failed to fetch page content")
-            return 0
+            return None
 
-        job_cards = soup.find_all('div', {'class': 'base-card'})
+        total_results = extract_total_results(document)
+        job_cards = document.select('div.base-card')
         if not job_cards:
-            return 0
+            return SearchPage(0, [], total_results, [], set())
 
         print(f"📊 Found {len(job_cards)} jobs on this page")
-        jobs_processed = 0
-        
-        for i, job in enumerate(job_cards, 1):
+        jobs = []
+        for job in job_cards:
             try:
-                title_elem = job.find('h3', {'class': 'base-search-card__title'})
-                company_elem = job.find('h4', {'class': 'base-search-card__subtitle'})
-                location_elem = job.find('span', {'class': 'job-search-card__location'})
-                link_elem = job.find('a', {'class': 'base-card__full-link'})
+                job_data = self._parse_job_card(job)
+                if job_data:
+                    jobs.append(job_data)
+            except Exception as e:
+                print(f"  ⚠️ Error processing job card: {e}")
 
-                if not all([title_elem, company_elem, location_elem, link_elem]):
-                    continue
+        card_ids = [job['job_id'] for job in jobs]
+        known_ids = set()
+        if self.job_index is not None:
+            known_ids = self.job_index.known(card_ids)
+            self.job_index.touch(known_ids)
+            if self.new_only:
+                jobs = [job for job in jobs if job['job_id'] not in known_ids]
+        new_jobs = self._claim_new_jobs(jobs)
+        if len(new_jobs) < len(card_ids):
+            print(f"⏭️ Skipping {len(card_ids) - len(new_jobs)} already fetched jobs")
+        return SearchPage(len(job_cards), new_jobs, total_results, card_ids, known_ids)
 
-                job_data = {
-                    'job_title': self._extract_text(title_elem),  # Changed from 'title'
-                    'company': self._extract_text(company_elem),   # Keep as 'company'
-                    'location': self._extract_text(location_elem), # Keep as 'location'
-                    'job_link': self._extract_link(link_elem),
-                    'tech_stack': self._extract_tech_stack(description), # Changed to 'tech_stack'
-                    'date_posted': self._extract_text(job.find('time'))
-                }
-
-                # Save description to file
-                desc_filename = f"job_desc_{int(time.time())}_{i}.txt"
-                desc_filepath = os.path.join(self.desc_folder, desc_filename)
-                description = self.job_desc_scraper.get_description(job_data['job_link'])
-                
-                with open(desc_filepath, 'w', encoding='utf-8') as f:
-                    f.write(description)
-
-                # Create markdown style links
-                job_link_md = f"[Job Link]({job_data['job_link']})"
-                desc_link_md = f"[Job Description]({desc_filename})"
-                
-                tech_stack = extract_tech_stack(description, self.tech_keywords)
-
-                writer.writerow([
-                    job_data['job_title'],    # Changed from 'title'
-                    job_data['company'],
-                    job_data['location'],
-                    job_link_md,  # Modified to markdown link
-                    desc_link_md,  # Modified to markdown link
-                    job_data['tech_stack']     # Changed from 'technologies'
-                ])
-
-                jobs_processed += 1
-                print(f"  ✓ [{i}/{len(job_cards)}] Processed: {job_data['job_title']} at {job_data['company']}")
-                time.sleep(self.config['scraper']['delay']['between_jobs'])
+    def _claim_new_jobs(self, jobs):
+        """Return the jobs no search has fetched or started fetching yet, and claim them."""
+        new_jobs = []
+        with self._claim_lock:
+            for job in jobs:
+                job_id = job['job_id']
+                if job_id:
+                    if job_id in self.checkpoint.seen_job_ids or job_id in self._claimed_ids:
+                        continue
+                    self._claimed_ids.add(job_id)
+                new_jobs.append(job)
+        return new_jobs
 
-            except Exception as e:
-                print(f"  ⚠️ Error processing job card: {e}")
-                continue
+    def _process_jobs(self, jobs, writer):
+        # Fan out description requests; the shared rate limiter keeps them polite
+        # and map() yields results in card order
+        jobs_processed = 0
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            descriptions = executor.map(self.job_desc_scraper.get_description, [job['job_link'] for job in jobs])
+
+            for i, (job_data, description) in enumerate(zip(jobs, descriptions), 1):
+                if self._record_job(writer, job_data, description, f"{i}/{len(jobs)}"):
+                    jobs_processed += 1
+
+        return jobs_processed
+
+    def _record_job(self, writer, job_data, description, label):
+        """Write one fetched job, or dead-letter it if its description failed."""
+        if description is None:
+            self.dead_letters.push('job', job_data['job_link'], 'description fetch failed', job=job_data)
+            print(f"  ❌ [{label}] Failed: {job_data['job_title']} at {job_data['company']}")
+            return False
+        try:
+            with self._write_lock:
+                self._write_job(writer, job_data, description)
+                if job_data['job_id']:
+                    self.checkpoint.mark_job(job_data['job_id'])
+                    if self.job_index is not None:
+                        self.job_index.add(job_data['job_id'])
+            print(f"  ✓ [{label}] Processed: {job_data['job_title']} at {job_data['company']}")
+            return True
+        except Exception as e:
+            print(f"  ⚠️ Error processing job card: {e}")
+            return False
+
+    def _parse_job_card(self, job):
+        title_elem = job.select_one('h3.base-search-card__title')
+        company_elem = job.select_one('h4.base-search-card__subtitle')
+        location_elem = job.select_one('span.job-search-card__location')
+        link_elem = job.select_one('a.base-card__full-link')
+
+        if not all([title_elem, company_elem, location_elem, link_elem]):
+            return None
+
+        job_link = self._extract_link(link_elem)
+        return {
+            'job_id': extract_job_id(job_link),
+            'job_title': self._extract_text(title_elem),
+            'company': self._extract_text(company_elem),
+            'location': self._extract_text(location_elem),
+            'job_link': job_link,
+            'date_posted': self._extract_text(job.select_one('time'))
+        }
+
+    def _write_job(self, writer, job_data, description):
+        writer.writerow(self._build_row(job_data, description))
+
+    def _build_row(self, job_data, description):
+        """Store the description and return the job's output row."""
+        description_key = job_data['job_id'] or job_data['job_link']
+        self.description_store.put(description_key, description)
+
+        # Create markdown style links
+        job_link_md = f"[Job Link]({job_data['job_link']})"
+        desc_link_md = f"[Job Description]({self.description_store.link(description_key)})"
+
+        tech_stack = extract_tech_stack(description, self.tech_matcher)
+
+        return [
+            job_data['job_title'],
+            job_data['company'],
+            job_data['location'],
+            job_link_md,
+            desc_link_md,
+            tech_stack
+        ]
+
+    @staticmethod
+    def _extract_text(elem):
+        return elem.text() if elem else ''
 
-        return jobs_processed
\ No newline at end of file
+    @staticmethod
+    def _extract_link(elem):
+        return elem.attr('href').split('?')[0] if elem else ''
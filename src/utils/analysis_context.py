@@ -0,0 +1,87 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import cached_property
+import numpy as np
+import pandas as pd
+from .cooccurrence import TechCooccurrence
+
+class AnalysisContext:
+    """Per-dataset intermediates shared by every analysis, each computed at most once.
+
+    Contexts are cached by a hash of the DataFrame's contents and index
+    (per-job results are labelled with the index), so calling
+    several analyses on the same data (or on an identical copy) reuses the
+    exploded technologies, the tech and pair counts and the city column
+    instead of rebuilding them. The cache keeps the `max_entries` most
+    recently used datasets. A context copies what it needs when it is built
+    and holds no reference to the frame, so later edits to the frame can
+    neither leak into it nor keep the frame alive.
+    """
+
+    max_entries = 4
+    _cache = OrderedDict()
+    _lock = threading.Lock()
+
+    def __init__(self, df: pd.DataFrame):
+        self.n_jobs = len(df)
+        self.index = df.index.copy()
+        # One row per (job, technology), indexed by the job's position in the frame
+        exploded = pd.Series(df['technologies'].to_numpy(), dtype=object).explode()
+        self.technologies = exploded[exploded.notna() & (exploded != '')]
+        if 'city' in df.columns:
+            self.cities = df['city'].copy()
+        else:
+            self.cities = df['location'].str.split(',').str[0]
+
+    @classmethod
+    def for_frame(cls, df: pd.DataFrame) -> 'AnalysisContext':
+        key = cls.content_hash(df)
+        with cls._lock:
+            context = cls._cache.get(key)
+            if context is None:
+                context = cls._cache[key] = cls(df)
+                while len(cls._cache) > cls.max_entries:
+                    cls._cache.popitem(last=False)
+            else:
+                cls._cache.move_to_end(key)
+        return context
+
+    @staticmethod
+    def content_hash(df: pd.DataFrame) -> str:
+        digest = hashlib.sha1(repr(list(df.columns)).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(df.index, categorize=False).to_numpy().tobytes())
+        for column in df.columns:
+            values = df[column]
+            if values.dtype == object and not pd.api.types.is_string_dtype(values):
+                # List cells are not hashable by pandas; their joined text is
+                try:
+                    values = pd.Series(['\x1f'.join(cell) for cell in values], dtype=object)
+                except TypeError:
+                    values = values.map(AnalysisContext._cell_text)
+            digest.update(pd.util.hash_pandas_object(values, index=False, categorize=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _cell_text(cell) -> str:
+        if isinstance(cell, (list, tuple, np.ndarray)):
+            return '\x1f'.join(map(str, cell))
+        return str(cell)
+
+    @cached_property
+    def tech_counts(self) -> pd.Series:
+        """Mentions of each technology, most frequent first."""
+        return self.technologies.value_counts()
+
+    @cached_property
+    def techs_per_job(self) -> pd.Series:
+        counts = self.technologies.groupby(level=0).size()
+        return pd.Series(counts.reindex(np.arange(self.n_jobs), fill_value=0).to_numpy(), index=self.index)
+
+    @cached_property
+    def cooccurrence(self) -> TechCooccurrence:
+        return TechCooccurrence.from_exploded(self.technologies, self.n_jobs)
+
+    @cached_property
+    def pair_counts(self) -> pd.Series:
+        return self.cooccurrence.pair_counts()
@@ -0,0 +1,88 @@
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+class CheckpointStore:
+    """Append-only journal of completed search pages and processed job IDs.
+
+    Job IDs are buffered until `commit` so the journal never claims a job
+    whose CSV row has not been flushed yet.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.seen_job_ids = set()
+        self.completed_starts = {}
+        self.completed_queries = set()
+        self.pending = []
+        self.lock = threading.Lock()
+
+    def load(self):
+        self.seen_job_ids.clear()
+        self.completed_starts.clear()
+        self.completed_queries.clear()
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn last line from a crash mid-write is expected
+                    logger.warning(f"Skipping unreadable checkpoint line in {self.path}")
+                    continue
+                if record['type'] == 'job':
+                    self.seen_job_ids.add(record['id'])
+                elif record['type'] == 'page':
+                    previous = self.completed_starts.get(record['query'], -1)
+                    self.completed_starts[record['query']] = max(previous, record['start'])
+                elif record['type'] == 'query':
+                    self.completed_queries.add(record['query'])
+        logger.info(f"Loaded checkpoint: {len(self.seen_job_ids)} jobs, {len(self.completed_starts)} queries")
+
+    def reset(self):
+        with self.lock:
+            self.seen_job_ids.clear()
+            self.completed_starts.clear()
+            self.completed_queries.clear()
+            self.pending.clear()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def last_completed_start(self, query: str):
+        return self.completed_starts.get(query)
+
+    def is_query_done(self, query: str) -> bool:
+        return query in self.completed_queries
+
+    def mark_job(self, job_id: str):
+        with self.lock:
+            self.seen_job_ids.add(job_id)
+            self.pending.append({'type': 'job', 'id': job_id})
+
+    def commit(self, query: str = None, start: int = None):
+        """Persist pending job IDs and, if given, the completed page offset."""
+        with self.lock:
+            records = self.pending
+            self.pending = []
+            if query is not None:
+                records.append({'type': 'page', 'query': query, 'start': start})
+                self.completed_starts[query] = max(self.completed_starts.get(query, -1), start)
+            self._append(records)
+
+    def complete_query(self, query: str):
+        """Record that a search reached its last page, so a resumed sweep skips it."""
+        with self.lock:
+            self.completed_queries.add(query)
+            self._append([{'type': 'query', 'query': query}])
+
+    def _append(self, records: list):
+        if not records:
+            return
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(record) + '\n' for record in records))
+            f.flush()
+            os.fsync(f.fileno())
@@ -0,0 +1,114 @@
+from functools import cached_property
+import networkx as nx
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+class TechCooccurrence:
+    """Jobs x technologies as a sparse binary matrix X, with every pair count from one X^T X.
+
+    Row i of X marks the technologies listed by job i. The diagonal of
+    X^T X holds how many jobs list each technology and the off-diagonal
+    entries how many list both of a pair, so per-job pair loops are never
+    needed. Pairs are reported as (tech_a, tech_b) with tech_a < tech_b.
+    """
+
+    def __init__(self, technologies):
+        jobs = pd.Series(list(technologies), dtype=object)
+        exploded = jobs.explode()
+        self._build(exploded[exploded.notna() & (exploded != '')], len(jobs))
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, column: str = 'technologies') -> 'TechCooccurrence':
+        return cls(df[column])
+
+    @classmethod
+    def from_exploded(cls, exploded: pd.Series, n_jobs: int) -> 'TechCooccurrence':
+        """Build from an already exploded (job position -> technology) series."""
+        cooccurrence = cls.__new__(cls)
+        cooccurrence._build(exploded, n_jobs)
+        return cooccurrence
+
+    @classmethod
+    def from_pair_counts(cls, pair_counts: pd.Series, tech_counts: pd.Series) -> 'TechCooccurrence':
+        """Build from counts already aggregated elsewhere, e.g. a JobStore's tech_pairs and tech_demand."""
+        cooccurrence = cls.__new__(cls)
+        cooccurrence.techs = np.asarray(tech_counts.index, dtype=object)
+        cooccurrence.matrix = None
+        techs = pd.Index(cooccurrence.techs)
+        first = techs.get_indexer(pair_counts.index.get_level_values(0))
+        second = techs.get_indexer(pair_counts.index.get_level_values(1))
+        diagonal = np.arange(len(techs))
+        # Empty SQL results come back as object dtype, which scipy.sparse rejects
+        pairs = pair_counts.to_numpy(dtype=np.int64)
+        jobs = tech_counts.to_numpy(dtype=np.int64)
+        # Seeds the cached `counts` directly; there is no job matrix to multiply
+        cooccurrence.__dict__['counts'] = sparse.csr_matrix(
+            (np.concatenate([pairs, pairs, jobs]),
+             (np.concatenate([first, second, diagonal]), np.concatenate([second, first, diagonal]))),
+            shape=(len(techs), len(techs))
+        )
+        return cooccurrence
+
+    def _build(self, exploded: pd.Series, n_jobs: int):
+        codes, names = pd.factorize(exploded.to_numpy())
+        self.techs = np.asarray(names, dtype=object)
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(codes), dtype=np.int32), (exploded.index.to_numpy(), codes)),
+            shape=(n_jobs, len(self.techs))
+        )
+        # A tech listed twice in one job still counts once
+        self.matrix.sum_duplicates()
+        self.matrix.data[:] = 1
+
+    @cached_property
+    def counts(self) -> sparse.csr_matrix:
+        """Tech x tech matrix: jobs listing both techs (diagonal: jobs listing the tech)."""
+        return (self.matrix.T @ self.matrix).tocsr()
+
+    def tech_counts(self) -> pd.Series:
+        return pd.Series(self.counts.diagonal(), index=self.techs).sort_values(ascending=False)
+
+    def pair_counts(self, min_count: int = 1) -> pd.Series:
+        """Jobs listing each pair of technologies, most frequent first."""
+        upper = sparse.triu(self.counts, k=1).tocoo()
+        keep = upper.data >= min_count
+        first, second, values = self.techs[upper.row[keep]], self.techs[upper.col[keep]], upper.data[keep]
+        swap = first > second
+        tech_a = np.where(swap, second, first)
+        tech_b = np.where(swap, first, second)
+        pairs = pd.Series(values, index=pd.MultiIndex.from_arrays([tech_a, tech_b]))
+        return pairs.sort_values(ascending=False, kind='stable')
+
+    def graph(self, min_weight: int = 1, min_share: float = 0.0) -> nx.Graph:
+        """Co-occurrence graph with a `weight` per edge, built straight from the sparse count matrix.
+
+        Pairs seen in fewer than `min_weight` jobs, or in less than
+        `min_share` of the rarer technology's jobs, are pruned first;
+        technologies left without edges are dropped.
+        """
+        upper = sparse.triu(self.counts, k=1).tocoo()
+        keep = upper.data >= min_weight
+        if min_share > 0:
+            jobs = self.counts.diagonal()
+            keep &= upper.data >= min_share * np.minimum(jobs[upper.row], jobs[upper.col])
+        pruned = sparse.csr_matrix((upper.data[keep], (upper.row[keep], upper.col[keep])), shape=upper.shape)
+        G = nx.from_scipy_sparse_array(pruned)
+        G.remove_nodes_from(list(nx.isolates(G)))
+        return nx.relabel_nodes(G, dict(enumerate(self.techs)))
+
+    def communities(self, min_weight: int = 1, min_share: float = 0.0,
+                    resolution: float = 1.0, seed: int = 42) -> list:
+        """Louvain communities of the pruned, weighted graph as sets of technologies, largest first.
+
+        The fixed `seed` makes the partition identical from run to run.
+        """
+        G = self.graph(min_weight, min_share)
+        if not G.number_of_edges():
+            return []
+        # Louvain visits nodes in graph order; sorting makes the result depend on the counts alone
+        ordered = nx.Graph()
+        ordered.add_nodes_from(sorted(G.nodes))
+        ordered.add_weighted_edges_from(sorted(G.edges(data='weight')))
+        communities = nx.community.louvain_communities(ordered, weight='weight', resolution=resolution, seed=seed)
+        return sorted(communities, key=len, reverse=True)
@@ -0,0 +1,43 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+class DeadLetterQueue:
+    """Append-only JSON-lines file of fetches that failed after all retries."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def push(self, kind: str, url: str, reason: str = '', **payload):
+        entry = {
+            'kind': kind,
+            'url': url,
+            'reason': reason,
+            'failed_at': datetime.now().isoformat(timespec='seconds'),
+            **payload
+        }
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+        logger.warning(f"Dead-lettered {kind} {url}: {reason}")
+
+    def drain(self) -> list:
+        """Return all pending entries and empty the file."""
+        with self.lock:
+            if not os.path.exists(self.path):
+                return []
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+            os.remove(self.path)
+        return entries
+
+    def __len__(self):
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return sum(1 for line in f if line.strip())
@@ -0,0 +1,139 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import zlib
+
+class DescriptionStore:
+    """Content-addressed, zlib-compressed store for scraped job descriptions.
+
+    Each distinct description body is stored once under its SHA-256, and
+    every job maps to the blob holding its description. Reposted jobs with
+    identical text share one blob, and the whole archive is a single file
+    that can be read back in one sequential scan. Writes are committed every
+    `batch_size` descriptions, so a description is only durable once a
+    batch commit, flush() or close() has run.
+    """
+
+    def __init__(self, path: str, batch_size: int = 100):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.pending = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS blobs (
+                hash TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                raw_size INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS job_blobs (
+                job_key TEXT PRIMARY KEY,
+                hash TEXT NOT NULL REFERENCES blobs (hash)
+            );
+            CREATE INDEX IF NOT EXISTS idx_job_blobs_hash ON job_blobs (hash);
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def config_path(config: dict) -> str:
+        return config['output'].get('description_store', 'job_descriptions.db')
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'DescriptionStore':
+        return cls(
+            cls.config_path(config),
+            batch_size=config['output'].get('buffer', {}).get('batch_size', 100)
+        )
+
+    def link(self, job_key: str) -> str:
+        """Reference to a job's description, as written to the output's description column."""
+        return f"{os.path.basename(self.path)}#{job_key}"
+
+    @staticmethod
+    def parse_link(link: str) -> str:
+        """Return the job key from a `link()` reference (or its markdown form), or None."""
+        if not isinstance(link, str):
+            return None
+        match = re.fullmatch(r'(?:\[[^\]]*\]\()?[^\s#()]+#([^\s#()]+)\)?', link.strip())
+        return match.group(1) if match else None
+
+    def put(self, job_key: str, description: str) -> str:
+        """Store a job's description and return its content hash; committed in batches."""
+        raw = description.encode('utf-8')
+        digest = hashlib.sha256(raw).hexdigest()
+        with self.lock:
+            exists = self.conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone()
+            if not exists:
+                body = zlib.compress(raw)
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO blobs (hash, body, size, raw_size) VALUES (?, ?, ?, ?)",
+                    (digest, body, len(body), len(raw))
+                )
+            self.conn.execute("INSERT OR REPLACE INTO job_blobs (job_key, hash) VALUES (?, ?)", (job_key, digest))
+            self.pending += 1
+            if self.pending >= self.batch_size:
+                self._commit()
+        return digest
+
+    def _commit(self):
+        self.conn.commit()
+        self.pending = 0
+
+    def flush(self):
+        with self.lock:
+            self._commit()
+
+    def get(self, job_key: str) -> str:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT b.body FROM job_blobs j JOIN blobs b ON b.hash = j.hash WHERE j.job_key = ?", (job_key,)
+            ).fetchone()
+        return zlib.decompress(row[0]).decode('utf-8') if row else None
+
+    def get_many(self, job_keys) -> dict:
+        """Descriptions for several jobs at once, as {job_key: text}; unknown keys are left out."""
+        job_keys = list(dict.fromkeys(key for key in job_keys if key))
+        found = {}
+        with self.lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(job_keys), 500):
+                batch = job_keys[start:start + 500]
+                rows = self.conn.execute(
+                    f"SELECT j.job_key, b.body FROM job_blobs j JOIN blobs b ON b.hash = j.hash "
+                    f"WHERE j.job_key IN ({','.join('?' * len(batch))})", batch
+                ).fetchall()
+                found.update((job_key, zlib.decompress(body).decode('utf-8')) for job_key, body in rows)
+        return found
+
+    def iter_descriptions(self):
+        """Yield (job_key, description) for every job, decompressing each shared blob once."""
+        # A separate connection streams the scan without holding the writer's lock
+        conn = sqlite3.connect(self.path)
+        try:
+            rows = conn.execute(
+                "SELECT j.job_key, j.hash, b.body FROM job_blobs j JOIN blobs b ON b.hash = j.hash ORDER BY j.hash"
+            )
+            last_hash, text = None, None
+            for job_key, digest, body in rows:
+                if digest != last_hash:
+                    last_hash, text = digest, zlib.decompress(body).decode('utf-8')
+                yield job_key, text
+        finally:
+            conn.close()
+
+    def stats(self) -> dict:
+        with self.lock:
+            jobs = self.conn.execute("SELECT COUNT(*) FROM job_blobs").fetchone()[0]
+            blobs, size, raw_size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(raw_size), 0) FROM blobs"
+            ).fetchone()
+        return {'jobs': jobs, 'blobs': blobs, 'bytes': size, 'raw_bytes': raw_size}
+
+    def close(self):
+        with self.lock:
+            self._commit()
+            self.conn.close()
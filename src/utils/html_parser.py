@@ -1,42 +1,284 @@
-import requests
 from bs4 import BeautifulSoup
+import codecs
 import logging
+from html.parser import HTMLParser
+from concurrent.futures import ProcessPoolExecutor
+import re
+from urllib.parse import urlparse
+from .keyword_matcher import KeywordMatcher
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401  (only needed as a BeautifulSoup tree builder)
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
 
 logger = logging.getLogger(__name__)
 
-def create_soup_from_url(url: str, headers: dict) -> BeautifulSoup:
+# Fastest first; 'auto' picks the first one that is installed
+PARSER_BACKENDS = ('selectolax', 'lxml', 'html.parser')
+
+def available_backends() -> list:
+    installed = {'selectolax': LexborHTMLParser is not None, 'lxml': HAS_LXML, 'html.parser': True}
+    return [backend for backend in PARSER_BACKENDS if installed[backend]]
+
+def resolve_backend(backend: str = 'auto') -> str:
+    available = available_backends()
+    if backend in (None, 'auto'):
+        return available[0]
+    if backend not in available:
+        logger.warning(f"HTML parser backend '{backend}' is not installed, using {available[0]}")
+        return available[0]
+    return backend
+
+class HtmlNode:
+    """Backend-neutral view of a parsed element with the few operations the scrapers need."""
+
+    def __init__(self, node, backend: str):
+        self.node = node
+        self.backend = backend
+
+    def select(self, css: str) -> list:
+        if self.backend == 'selectolax':
+            return [HtmlNode(node, self.backend) for node in self.node.css(css)]
+        return [HtmlNode(node, self.backend) for node in self.node.select(css)]
+
+    def select_one(self, css: str):
+        node = self.node.css_first(css) if self.backend == 'selectolax' else self.node.select_one(css)
+        return HtmlNode(node, self.backend) if node is not None else None
+
+    def text(self) -> str:
+        """Visible text with whitespace collapsed, identical across backends."""
+        if self.backend == 'selectolax':
+            for hidden in self.node.css('script, style'):
+                hidden.decompose()
+            raw = self.node.text(separator=' ', strip=True)
+        else:
+            raw = self.node.get_text(separator=' ', strip=True)
+        return ' '.join(raw.split())
+
+    def attr(self, name: str, default: str = '') -> str:
+        if self.backend == 'selectolax':
+            value = self.node.attributes.get(name)
+        else:
+            value = self.node.get(name)
+        return value if value is not None else default
+
+def parse_html(markup: str, backend: str = 'auto') -> HtmlNode:
+    backend = resolve_backend(backend)
+    if backend == 'selectolax':
+        return HtmlNode(LexborHTMLParser(markup), backend)
+    return HtmlNode(BeautifulSoup(markup, backend), backend)
+
+def fetch_document(url: str, client, backend: str = 'auto') -> HtmlNode:
     try:
-        response = requests.get(url, headers=headers)
+        response = client.get(url)
         response.raise_for_status()
-        return BeautifulSoup(response.text, 'html.parser')
+        return parse_html(response.text, backend)
     except Exception as e:
         logger.error(f"Error fetching URL {url}: {e}")
         return None
 
-def extract_tech_stack(description: str, tech_keywords: list) -> str:
-    """Extract technology stack from job description with improved matching."""
-    if not description or not tech_keywords:
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+}
+
+class SectionTextExtractor(HTMLParser):
+    """Incremental parser that keeps only the text of the best matching container.
+
+    `containers` is a list of (tag, class) pairs in priority order, like the
+    selectors tried one after another on a parsed page. The first element
+    matching each pair is captured, including containers nested inside
+    other captures. `done` is set as soon as a capture closes that is the
+    top-priority container, or that neither holds nor sits inside a
+    higher-priority one, so the caller can stop reading. A higher-priority
+    container that only starts after that point is not seen.
+    """
+
+    def __init__(self, containers):
+        super().__init__(convert_charrefs=True)
+        self.containers = containers
+        self.stack = []
+        self.hidden_depth = 0
+        self.open_captures = []
+        self.finished = {}
+        self.started = set()
+        self.result = None
+        self.done = False
+
+    def _match(self, tag, attrs):
+        classes = (dict(attrs).get('class') or '').split()
+        for priority, (container_tag, container_class) in enumerate(self.containers):
+            if tag == container_tag and container_class in classes:
+                return priority
+        return None
+
+    def _append(self, text):
+        for capture in self.open_captures:
+            capture['parts'].append(text)
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag in VOID_ELEMENTS:
+            self._append(' ')
+            return
+        priority = self._match(tag, attrs)
+        if self.stack:
+            self.stack.append(tag)
+            self._append(' ')
+            if tag in ('script', 'style'):
+                self.hidden_depth += 1
+        if priority is None or priority in self.started:
+            return
+        self.started.add(priority)
+        for capture in self.open_captures:
+            if capture['priority'] > priority:
+                capture['holds_better'] = True
+        if not self.stack:
+            self.stack.append(tag)
+        self.open_captures.append(
+            {'priority': priority, 'depth': len(self.stack) - 1, 'parts': [], 'holds_better': False}
+        )
+
+    def handle_endtag(self, tag):
+        if self.done or tag not in self.stack:
+            return
+        self._append(' ')
+        # Pop implicitly closed children (<p>, <li> without end tags) up to this tag
+        while self.stack:
+            closed = self.stack.pop()
+            if closed in ('script', 'style'):
+                self.hidden_depth -= 1
+            if closed == tag:
+                break
+        for capture in [c for c in self.open_captures if c['depth'] >= len(self.stack)]:
+            self.open_captures.remove(capture)
+            text = self._text(capture)
+            self.finished.setdefault(capture['priority'], text)
+            better_open = any(other['priority'] < capture['priority'] for other in self.open_captures)
+            if capture['priority'] == 0 or not (capture['holds_better'] or better_open):
+                self.result = text
+                self.done = True
+                return
+
+    def handle_data(self, data):
+        if self.open_captures and not self.done and not self.hidden_depth:
+            self._append(data)
+
+    @staticmethod
+    def _text(capture) -> str:
+        # Text runs may arrive split across feeds, so separators only go at tag boundaries
+        return ' '.join(''.join(capture['parts']).split())
+
+    def text(self) -> str:
+        """Text of the chosen container, else the best one seen (possibly unclosed), else None."""
+        if self.result is not None:
+            return self.result
+        if self.finished:
+            return self.finished[min(self.finished)]
+        if self.open_captures:
+            return self._text(min(self.open_captures, key=lambda capture: capture['priority']))
+        return None
+
+# Bytes read past the description so the keep-alive connection can go back to the pool
+STREAM_DRAIN_LIMIT = 65536
+
+def stream_section_text(response, containers, chunk_size: int = 16384,
+                        drain_limit: int = STREAM_DRAIN_LIMIT) -> str:
+    """Read a streamed response only until the description container closes.
+
+    Returns the container's text (whitespace collapsed, like HtmlNode.text),
+    or None if the document has no such container. Once the text is found,
+    up to `drain_limit` more bytes are read: a fully read response keeps its
+    pooled connection, while a longer remainder is cut off by closing the
+    connection, trading a reconnect for not downloading the rest of the page.
+    """
+    extractor = SectionTextExtractor(containers)
+    decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+    chunks = response.iter_content(chunk_size=chunk_size)
+    try:
+        for chunk in chunks:
+            extractor.feed(decoder.decode(chunk))
+            if extractor.done:
+                break
+        else:
+            extractor.feed(decoder.decode(b'', final=True))
+            extractor.close()
+        if extractor.done:
+            drained = 0
+            for chunk in chunks:
+                drained += len(chunk)
+                if drained > drain_limit:
+                    break
+    finally:
+        # A drained response releases its connection to the pool; otherwise this drops it
+        response.close()
+    return extractor.text()
+
+def extract_job_id(url: str) -> str:
+    """Return the numeric LinkedIn job ID from a job view URL, or None."""
+    if not url:
+        return None
+    match = re.search(r'(\d{6,})/?$', urlparse(url).path)
+    return match.group(1) if match else None
+
+def extract_total_results(document) -> int:
+    """Return the result count from a search page's results header, or None if absent."""
+    count_elem = document.select_one('span.results-context-header__job-count')
+    if not count_elem:
+        return None
+    digits = re.sub(r'\D', '', count_elem.text())
+    return int(digits) if digits else None
+
+def extract_tech_stack(description: str, matcher: KeywordMatcher) -> str:
+    """Extract technology stack from job description with a precompiled matcher."""
+    if not description or not matcher:
         return "Not specified"
-    
-    found_tech = set()  # Use set to avoid duplicates
-    description_lower = description.lower()
-    
-    # Process each keyword
-    for tech in tech_keywords:
-        # Handle variations of the same technology
-        tech_variations = {
-            tech.lower(),
-            tech.lower().replace(' ', ''),
-            tech.lower().replace('-', ''),
-            tech.lower().replace('.', '')
-        }
-        
-        # Check for each variation
-        if any(variant in description_lower for variant in tech_variations):
-            found_tech.add(tech)
-    
+    if not isinstance(matcher, KeywordMatcher):
+        matcher = KeywordMatcher.from_keywords(matcher)
+
+    found_tech = matcher.find(description)
     return ', '.join(sorted(found_tech)) if found_tech else 'Not specified'
 
+_worker_matcher = None
+
+def _init_worker(matcher):
+    global _worker_matcher
+    _worker_matcher = matcher
+
+def _extract_chunk(descriptions: list) -> list:
+    return [extract_tech_stack(description, _worker_matcher) for description in descriptions]
+
+def extract_tech_stacks(descriptions, matcher: KeywordMatcher = None, processes: int = None,
+                        chunksize: int = 500):
+    """Extract tech stacks for many descriptions in one pass.
+
+    Accepts any iterable of strings; a pandas Series comes back as a Series
+    with the same index. With `processes` > 1 the work is split into chunks
+    across a process pool, each worker receiving the matcher once.
+    """
+    matcher = matcher or KeywordMatcher.from_index()
+    texts = [description if isinstance(description, str) else '' for description in descriptions]
+
+    if processes and processes > 1 and len(texts) > chunksize:
+        chunks = [texts[i:i + chunksize] for i in range(0, len(texts), chunksize)]
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(matcher,)) as executor:
+            results = [stack for chunk in executor.map(_extract_chunk, chunks) for stack in chunk]
+    else:
+        results = [extract_tech_stack(text, matcher) for text in texts]
+
+    if hasattr(descriptions, 'index') and hasattr(descriptions, 'dtype'):
+        import pandas as pd
+        return pd.Series(results, index=descriptions.index, name='tech_stack')
+    return results
+
 def clean_text(text: str) -> str:
     """Clean and normalize text content."""
     if not text:
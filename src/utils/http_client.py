@@ -0,0 +1,62 @@
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from .rate_limiter import RateLimiter, THROTTLE_STATUS_CODES, parse_retry_after
+from .retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+class HttpClient:
+    """Scraper-wide HTTP client backed by a pooled keep-alive session."""
+
+    def __init__(self, headers: dict = None, pool_size: int = 10,
+                 connect_timeout: float = 5, read_timeout: float = 30,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None):
+        self.timeout = (connect_timeout, read_timeout)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=1)
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'HttpClient':
+        scraper_config = config['scraper']
+        http_config = scraper_config.get('http', {})
+        return cls(
+            headers=scraper_config.get('headers'),
+            pool_size=http_config.get('pool_size', max(10, scraper_config.get('max_concurrency', 1))),
+            connect_timeout=http_config.get('connect_timeout', 5),
+            read_timeout=http_config.get('read_timeout', 30),
+            rate_limiter=RateLimiter.from_config(config),
+            retry_policy=RetryPolicy.from_config(config)
+        )
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET with rate limiting; raises HTTPError for error statuses once retries are spent."""
+        kwargs.setdefault('timeout', self.timeout)
+        return self.retry_policy.call(self._get_once, url, **kwargs)
+
+    def _get_once(self, url: str, **kwargs) -> requests.Response:
+        if self.rate_limiter:
+            self.rate_limiter.acquire(url)
+
+        response = self.session.get(url, **kwargs)
+
+        if response.status_code in THROTTLE_STATUS_CODES:
+            if self.rate_limiter:
+                self.rate_limiter.backoff(url, parse_retry_after(response.headers.get('Retry-After')))
+            response.close()
+            raise requests.HTTPError(f"Throttled with status {response.status_code} for url: {url}", response=response)
+        if self.rate_limiter:
+            self.rate_limiter.record_success(url)
+        if response.status_code >= 400:
+            response.close()
+        response.raise_for_status()
+        return response
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,80 @@
+import sqlite3
+import threading
+from datetime import date
+
+class JobIndex:
+    """Persistent index of every job ID ever listed, with first-seen and last-seen dates.
+
+    Full runs keep it up to date; new-postings-only runs use it to skip jobs
+    that were already fetched and to tell when the recency-sorted results
+    have reached postings from earlier runs.
+    """
+
+    def __init__(self, path: str):
+        self.lock = threading.Lock()
+        # IDs this run added; parallel searches must not count them as known from earlier runs
+        self.added_ids = set()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs_seen (
+                job_id TEXT PRIMARY KEY,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    @classmethod
+    def from_config(cls, config: dict):
+        """Build the index from scraper.job_index, or return None when it is disabled."""
+        index_config = config['scraper'].get('job_index', {})
+        if not index_config.get('enabled', False):
+            return None
+        return cls(index_config.get('path', 'job_index.db'))
+
+    def known(self, job_ids) -> set:
+        """Return the subset of `job_ids` indexed by earlier runs."""
+        job_ids = [job_id for job_id in job_ids if job_id]
+        if not job_ids:
+            return set()
+        placeholders = ','.join('?' * len(job_ids))
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT job_id FROM jobs_seen WHERE job_id IN ({placeholders})", job_ids
+            ).fetchall()
+            return {row[0] for row in rows} - self.added_ids
+
+    def touch(self, job_ids):
+        """Record that known jobs are still listed today."""
+        today = date.today().isoformat()
+        with self.lock:
+            self.conn.executemany(
+                "UPDATE jobs_seen SET last_seen = ? WHERE job_id = ?", [(today, job_id) for job_id in job_ids]
+            )
+
+    def add(self, job_id: str):
+        today = date.today().isoformat()
+        with self.lock:
+            inserted = self.conn.execute(
+                "INSERT OR IGNORE INTO jobs_seen (job_id, first_seen, last_seen) VALUES (?, ?, ?)",
+                (job_id, today, today)
+            ).rowcount
+            if inserted:
+                self.added_ids.add(job_id)
+            else:
+                self.conn.execute("UPDATE jobs_seen SET last_seen = ? WHERE job_id = ?", (today, job_id))
+
+    def flush(self):
+        """Commit the touches and additions made since the last flush."""
+        with self.lock:
+            self.conn.commit()
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM jobs_seen").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.conn.commit()
+            self.conn.close()
@@ -0,0 +1,156 @@
+import re
+import sqlite3
+import threading
+import time
+import pandas as pd
+from .html_parser import extract_job_id
+
+class JobStore:
+    """SQLite job store: one row per LinkedIn job ID plus a normalized job -> tech table.
+
+    As an output sink it upserts every scraped row, so re-scraping a job
+    updates it instead of adding a duplicate. The query methods run the
+    dashboard aggregates in SQL on the indexed columns, optionally filtered
+    by city and technology, so nothing has to be loaded into pandas first.
+    """
+
+    def __init__(self, path: str, columns: list = None):
+        self.path = path
+        self.columns = list(columns) if columns else None
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                job_title TEXT,
+                company TEXT,
+                location TEXT,
+                city TEXT,
+                job_link TEXT,
+                job_description TEXT,
+                tech_stack TEXT,
+                first_scraped REAL NOT NULL,
+                last_scraped REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS job_tech (
+                job_id TEXT NOT NULL REFERENCES jobs (job_id) ON DELETE CASCADE,
+                tech TEXT NOT NULL,
+                PRIMARY KEY (job_id, tech)
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);
+            CREATE INDEX IF NOT EXISTS idx_jobs_city ON jobs (city);
+            CREATE INDEX IF NOT EXISTS idx_job_tech_tech ON job_tech (tech, job_id);
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def _link_target(value: str) -> str:
+        """URL inside a markdown link such as [Job Link](url), or the value itself."""
+        match = re.fullmatch(r'\[[^\]]*\]\((.*)\)', value or '')
+        return match.group(1) if match else value
+
+    def writerow(self, row: list):
+        record = dict(zip(self.columns, row))
+        job_link = self._link_target(record.get('job_link', ''))
+        job_id = extract_job_id(job_link) or job_link
+        location = record.get('location', '')
+        tech_stack = record.get('tech_stack', '')
+        techs = [] if tech_stack == 'Not specified' else sorted(
+            {tech.strip() for tech in tech_stack.split(',') if tech.strip()}
+        )
+        now = time.time()
+        with self.lock:
+            self.conn.execute("""
+                INSERT INTO jobs (job_id, job_title, company, location, city, job_link, job_description,
+                                  tech_stack, first_scraped, last_scraped)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(job_id) DO UPDATE SET
+                    job_title = excluded.job_title, company = excluded.company, location = excluded.location,
+                    city = excluded.city, job_link = excluded.job_link, job_description = excluded.job_description,
+                    tech_stack = excluded.tech_stack, last_scraped = excluded.last_scraped
+            """, (job_id, record.get('job_title'), record.get('company'), location, location.split(',')[0].strip(),
+                  job_link, record.get('job_description'), tech_stack, now, now))
+            self.conn.execute("DELETE FROM job_tech WHERE job_id = ?", (job_id,))
+            self.conn.executemany("INSERT INTO job_tech (job_id, tech) VALUES (?, ?)", [(job_id, tech) for tech in techs])
+
+    def flush(self):
+        with self.lock:
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.commit()
+            self.conn.close()
+
+    @staticmethod
+    def _filters(cities=None, techs=None):
+        """WHERE clause and parameters restricting `jobs j` to the given cities and technologies."""
+        clauses, params = [], []
+        if cities:
+            clauses.append(f"j.city IN ({','.join('?' * len(cities))})")
+            params.extend(cities)
+        if techs:
+            clauses.append(f"j.job_id IN (SELECT job_id FROM job_tech WHERE tech IN ({','.join('?' * len(techs))}))")
+            params.extend(techs)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def query(self, sql: str, params=()) -> pd.DataFrame:
+        with self.lock:
+            return pd.read_sql_query(sql, self.conn, params=list(params))
+
+    def summary(self, cities=None, techs=None) -> dict:
+        where, params = self._filters(cities, techs)
+        row = self.query(f"""
+            SELECT COUNT(*) AS total_jobs, COUNT(DISTINCT j.company) AS unique_companies,
+                   COUNT(DISTINCT j.location) AS locations, COUNT(DISTINCT j.city) AS unique_cities
+            FROM jobs j{where}
+        """, params).iloc[0]
+        return {column: int(value) for column, value in row.items()}
+
+    def tech_demand(self, cities=None, techs=None) -> pd.Series:
+        where, params = self._filters(cities, techs)
+        df = self.query(f"""
+            SELECT t.tech, COUNT(*) AS jobs FROM job_tech t JOIN jobs j ON j.job_id = t.job_id{where}
+            GROUP BY t.tech ORDER BY jobs DESC
+        """, params)
+        return pd.Series(df['jobs'].values, index=df['tech'].values)
+
+    def hiring_velocity(self, cities=None, techs=None) -> pd.DataFrame:
+        where, params = self._filters(cities, techs)
+        return self.query(f"""
+            SELECT j.company, COUNT(DISTINCT j.job_id) AS job_count,
+                   COUNT(DISTINCT j.location) AS locations_count, COUNT(DISTINCT t.tech) AS unique_technologies
+            FROM jobs j LEFT JOIN job_tech t ON t.job_id = j.job_id{where}
+            GROUP BY j.company
+        """, params).set_index('company')
+
+    def location_concentration(self, cities=None, techs=None) -> pd.DataFrame:
+        where, params = self._filters(cities, techs)
+        stats = self.query(f"""
+            SELECT j.location, COUNT(DISTINCT j.job_id) AS job_title, COUNT(DISTINCT j.company) AS company,
+                   COUNT(DISTINCT t.tech) AS tech_stack
+            FROM jobs j LEFT JOIN job_tech t ON t.job_id = j.job_id{where}
+            GROUP BY j.location
+        """, params).set_index('location')
+        stats['tech_diversity'] = stats['tech_stack'] / stats['job_title']
+        return stats
+
+    def tech_pairs(self, cities=None, techs=None) -> pd.Series:
+        """Number of jobs listing each pair of technologies, keyed by (tech_a, tech_b) with tech_a < tech_b."""
+        where, params = self._filters(cities, techs)
+        df = self.query(f"""
+            SELECT a.tech AS tech_a, b.tech AS tech_b, COUNT(*) AS jobs
+            FROM job_tech a
+            JOIN job_tech b ON b.job_id = a.job_id AND a.tech < b.tech
+            JOIN jobs j ON j.job_id = a.job_id{where}
+            GROUP BY a.tech, b.tech
+        """, params)
+        return pd.Series(df['jobs'].values, index=pd.MultiIndex.from_arrays([df['tech_a'], df['tech_b']]))
+
+    def cities(self) -> list:
+        return self.query("SELECT DISTINCT city FROM jobs ORDER BY city")['city'].tolist()
+
+    def technologies(self) -> list:
+        return self.query("SELECT DISTINCT tech FROM job_tech ORDER BY tech")['tech'].tolist()
@@ -0,0 +1,101 @@
+from collections import deque
+from ..constants.tech_taxonomy import TECH_INDEX, TechPattern
+
+class KeywordMatcher:
+    """Aho-Corasick automaton that finds every pattern in a single pass over the text.
+
+    The automaton runs over the lowercased text; case-sensitive patterns and
+    word-boundary rules are checked only at the positions where a pattern ends.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        # Node 0 is the root; each node is a dict of char -> child node index
+        self.transitions = [{}]
+        self.fail = [0]
+        self.outputs = [()]
+        self._build()
+
+    @classmethod
+    def from_index(cls, index: dict = None) -> 'KeywordMatcher':
+        """Matcher over a compiled taxonomy index (defaults to TECH_INDEX)."""
+        return cls((index if index is not None else TECH_INDEX).values())
+
+    @classmethod
+    def from_keywords(cls, keywords) -> 'KeywordMatcher':
+        """Plain substring matcher over a keyword list and its space/hyphen/dot-less variants."""
+        patterns = []
+        for keyword in dict.fromkeys(keywords):
+            lowered = keyword.lower()
+            variants = {lowered, lowered.replace(' ', ''), lowered.replace('-', ''), lowered.replace('.', '')}
+            patterns.extend(TechPattern(keyword, variant, False, False) for variant in variants if variant)
+        return cls(patterns)
+
+    def _build(self):
+        outputs = [[]]
+        for pattern in self.patterns:
+            node = 0
+            for char in pattern.text.lower():
+                next_node = self.transitions[node].get(char)
+                if next_node is None:
+                    next_node = len(self.transitions)
+                    self.transitions[node][char] = next_node
+                    self.transitions.append({})
+                    outputs.append([])
+                node = next_node
+            outputs[node].append(pattern)
+
+        # Breadth-first pass to set failure links and merge inherited outputs
+        self.fail = [0] * len(self.transitions)
+        queue = deque(self.transitions[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.transitions[node].items():
+                fallback = self.fail[node]
+                while fallback and char not in self.transitions[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.transitions[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                outputs[child] = outputs[child] + outputs[self.fail[child]]
+                queue.append(child)
+        self.outputs = [tuple(output) for output in outputs]
+
+    def find(self, text: str) -> set:
+        """Return the set of canonical names matched anywhere in `text`."""
+        found = set()
+        if not text:
+            return found
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters (e.g. 'İ') lowercase to two; keep offsets aligned
+            lowered = ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+        transitions, fail, outputs = self.transitions, self.fail, self.outputs
+        text_length = len(text)
+        node = 0
+        for end, char in enumerate(lowered):
+            while node and char not in transitions[node]:
+                node = fail[node]
+            node = transitions[node].get(char, 0)
+            for pattern in outputs[node]:
+                if pattern.name in found:
+                    continue
+                start = end - len(pattern.text) + 1
+                if pattern.case_sensitive and text[start:end + 1] != pattern.text:
+                    continue
+                if pattern.word_boundary:
+                    if pattern.text[0].isalnum() and start > 0 and text[start - 1].isalnum():
+                        continue
+                    if pattern.text[-1].isalnum() and not self._ends_word(text, end + 1, text_length):
+                        continue
+                found.add(pattern.name)
+        return found
+
+    @staticmethod
+    def _ends_word(text: str, position: int, text_length: int) -> bool:
+        """True if a word ends at `position`, allowing a plural 's' (Data Lakes, ELTs)."""
+        if position >= text_length or not text[position].isalnum():
+            return True
+        if text[position] in 'sS':
+            return position + 1 >= text_length or not text[position + 1].isalnum()
+        return False
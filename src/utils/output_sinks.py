@@ -0,0 +1,212 @@
+import csv
+import os
+import time
+from .description_store import DescriptionStore
+from .job_store import JobStore
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pacsv = None
+    pq = None
+
+class CsvSink:
+    """Row sink writing the output CSV; a new file starts with the header row.
+
+    Rows are buffered and written with one writerows call once `batch_size`
+    rows are waiting, or when a row arrives `flush_interval` seconds after
+    the last write; there is no timer, so a stalled crawl writes nothing.
+    Only flush(), which the scraper calls before each page checkpoint, and
+    close() guarantee that rows have reached the file. flush() leaves them
+    in the OS cache, safe from a crash of the process; the file is fsynced
+    at most every `fsync_interval` seconds, and on close.
+    """
+
+    def __init__(self, path: str, columns: list, append: bool = False, batch_size: int = 100,
+                 flush_interval: float = 5.0, fsync_interval: float = 30.0):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.rows = []
+        self.last_write = self.last_fsync = time.monotonic()
+        write_header = not (append and os.path.exists(path))
+        self.file = open(path, mode='a' if append else 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        if write_header:
+            self.writer.writerow(columns)
+
+    def writerow(self, row: list):
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size or time.monotonic() - self.last_write >= self.flush_interval:
+            self._write_rows()
+
+    def _write_rows(self):
+        if self.rows:
+            self.writer.writerows(self.rows)
+            self.rows = []
+        self.last_write = time.monotonic()
+
+    def flush(self):
+        self._write_rows()
+        self.file.flush()
+        if time.monotonic() - self.last_fsync >= self.fsync_interval:
+            os.fsync(self.file.fileno())
+            self.last_fsync = time.monotonic()
+
+    def close(self):
+        self._write_rows()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+class ParquetSink:
+    """Parquet copy of the CSV output, with `technologies` as a list column and the full description text.
+
+    The CSV, which the checkpoint tracks, is the record of a run, so the
+    Parquet file is rebuilt from it on close rather than written row by
+    row. A crashed run leaves the previous file in place, and the next
+    run's close brings it back in line with the CSV, resumed rows
+    included. The CSV is streamed through pyarrow's CSV reader into row
+    groups of `row_group_size` rows, description links are resolved
+    against the description store, and the file is written under a
+    temporary name and moved into place.
+    """
+
+    def __init__(self, path: str, csv_path: str, columns: list, row_group_size: int = 5000,
+                 description_store=None):
+        if pa is None:
+            raise ImportError("The Parquet sink needs the pyarrow package (pip install pyarrow)")
+        self.path = path
+        self.csv_path = csv_path
+        self.columns = list(columns)
+        self.row_group_size = max(1, row_group_size)
+        self.description_store = description_store
+        self.schema = pa.schema(
+            [(column, pa.string()) for column in self.columns] + [('technologies', pa.list_(pa.string()))]
+        )
+
+    @staticmethod
+    def _technologies(tech_stack: str) -> list:
+        # Same list DataProcessor.load_data builds from the CSV, 'Not specified' included
+        return [tech.strip() for tech in str(tech_stack).split(',') if tech.strip()]
+
+    def _descriptions(self, links: list) -> list:
+        if self.description_store is None:
+            return links
+        keys = [self.description_store.parse_link(link) for link in links]
+        texts = self.description_store.get_many(keys)
+        return [texts.get(key, link) for key, link in zip(keys, links)]
+
+    def writerow(self, row: list):
+        # Rows reach the Parquet file through the CSV when the sink closes
+        pass
+
+    def flush(self):
+        pass
+
+    def _read_csv(self):
+        # The header names the columns; everything stays a string, as in the CSV
+        return pacsv.open_csv(
+            self.csv_path,
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={column: pa.string() for column in self.columns}, strings_can_be_null=False
+            )
+        )
+
+    def _convert(self, table) -> 'pa.Table':
+        data = {
+            column: table[column].to_pylist() if column in table.column_names else [''] * table.num_rows
+            for column in self.columns
+        }
+        if 'job_description' in data:
+            data['job_description'] = self._descriptions(data['job_description'])
+        data['technologies'] = [self._technologies(value) for value in data['tech_stack']] \
+            if 'tech_stack' in data else [[] for _ in range(table.num_rows)]
+        return pa.Table.from_pydict(data, schema=self.schema)
+
+    def rebuild(self):
+        """Write the Parquet file from the current CSV, in full row groups."""
+        temp_path = f"{self.path}.tmp"
+        with pq.ParquetWriter(temp_path, self.schema) as writer:
+            pending, pending_rows = [], 0
+            batches = self._read_csv() if os.path.exists(self.csv_path) else []
+            for batch in batches:
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                if pending_rows >= self.row_group_size:
+                    table = pa.Table.from_batches(pending)
+                    full = pending_rows - pending_rows % self.row_group_size
+                    writer.write_table(self._convert(table.slice(0, full)), row_group_size=self.row_group_size)
+                    rest = table.slice(full)
+                    pending, pending_rows = rest.to_batches(), rest.num_rows
+            if pending_rows:
+                writer.write_table(self._convert(pa.Table.from_batches(pending)), row_group_size=self.row_group_size)
+        os.replace(temp_path, self.path)
+
+    def close(self):
+        self.rebuild()
+
+class OutputSinks:
+    """Fans every row out to several sinks, e.g. the CSV and a Parquet copy.
+
+    `stores` (the description store, the job index) batch their own writes;
+    they are flushed together with the sinks so a checkpoint taken after
+    flush() never runs ahead of any output. The stores belong to the
+    caller, which may open several outputs over them, so close() commits
+    them but leaves closing them to their owner.
+    """
+
+    def __init__(self, sinks: list, stores: list = ()):
+        self.sinks = sinks
+        self.stores = [store for store in stores if store is not None]
+
+    def writerow(self, row: list):
+        for sink in self.sinks:
+            sink.writerow(row)
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+        for store in self.stores:
+            store.flush()
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+        for store in self.stores:
+            store.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def create_sinks(config: dict, append: bool = False, stores: list = ()) -> OutputSinks:
+    """The CSV output plus any sinks enabled under output (output.parquet, output.sqlite)."""
+    output_config = config['output']
+    columns = output_config['columns']
+    buffer_config = output_config.get('buffer', {})
+    sinks = [CsvSink(
+        output_config['file'], columns, append,
+        batch_size=buffer_config.get('batch_size', 100),
+        flush_interval=buffer_config.get('flush_interval_seconds', 5),
+        fsync_interval=buffer_config.get('fsync_interval_seconds', 30)
+    )]
+    parquet_config = output_config.get('parquet', {})
+    if parquet_config.get('enabled', False):
+        sinks.append(ParquetSink(
+            parquet_config.get('file', os.path.splitext(output_config['file'])[0] + '.parquet'),
+            output_config['file'], columns, row_group_size=parquet_config.get('row_group_size', 5000),
+            description_store=next((store for store in stores if isinstance(store, DescriptionStore)), None)
+        ))
+    sqlite_config = output_config.get('sqlite', {})
+    if sqlite_config.get('enabled', False):
+        # Upserts by job ID, so appending and rewriting are the same thing here
+        sinks.append(JobStore(sqlite_config.get('file', 'jobs.db'), columns))
+    return OutputSinks(sinks, stores)
@@ -0,0 +1,45 @@
+import math
+
+class PaginationTracker:
+    """Decides when a search has run out of real results.
+
+    LinkedIn's guest search keeps serving recycled cards past the end of the
+    results, so an empty page can be many fetches away. The result count in
+    the header of the first page sets a page budget, and a page whose cards
+    were all listed on earlier pages of the same search ends it too.
+
+    With `stop_after_known`, recency-sorted results also end after that many
+    consecutive postings indexed by earlier runs; IDs
+    that parallel searches of the current run added do not count.
+    """
+
+    def __init__(self, jobs_per_page: int, stop_after_known: int = None):
+        self.jobs_per_page = jobs_per_page
+        self.stop_after_known = stop_after_known
+        self.last_page = None
+        self.listed_ids = set()
+        self.known_run = 0
+
+    def stop_reason(self, page: int, search_page) -> str:
+        """Return why pagination should stop after `page`, or None to fetch the next one."""
+        if not search_page.cards_found:
+            return "No more jobs found on this page"
+
+        if self.last_page is None and search_page.total_results:
+            self.last_page = math.ceil(search_page.total_results / self.jobs_per_page) - 1
+            print(f"📊 {search_page.total_results} results, at most {self.last_page + 1} pages")
+
+        if self.stop_after_known:
+            for job_id in search_page.card_ids:
+                self.known_run = self.known_run + 1 if job_id in search_page.known_ids else 0
+                if self.known_run >= self.stop_after_known:
+                    return f"Reached {self.known_run} known postings in a row"
+
+        card_ids = set(job_id for job_id in search_page.card_ids if job_id)
+        if card_ids and card_ids <= self.listed_ids:
+            return "Page only repeats jobs from earlier pages"
+        self.listed_ids.update(card_ids)
+
+        if self.last_page is not None and page >= self.last_page:
+            return "Reached the last page of results"
+        return None
@@ -0,0 +1,138 @@
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# LinkedIn answers 999 instead of 429 when it wants a client to slow down
+THROTTLE_STATUS_CODES = {429, 999}
+
+def parse_retry_after(value) -> float:
+    """Return the Retry-After header as seconds, or None if absent/invalid."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at `rate` tokens per second."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                # Nothing refills during a pause, so the bucket starts empty when it lifts
+                refill_from = max(self.updated, self.blocked_until)
+                self.tokens = min(self.capacity, self.tokens + max(0.0, now - refill_from) * self.rate)
+                self.updated = now
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+class SharedTokenBucket:
+    """TokenBucket whose state lives in a budget store shared by every worker process."""
+
+    def __init__(self, store, host: str, rate: float, burst: int):
+        self.store = store
+        self.host = host
+        self.rate = rate
+        self.capacity = max(1, burst)
+
+    def acquire(self):
+        while True:
+            wait = self.store.take_token(self.host, self.rate, self.capacity)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        self.store.pause(self.host, seconds)
+
+class RateLimiter:
+    """Per-host token buckets with adaptive backoff on throttling responses.
+
+    With a `budget_store` (a task queue backend) the buckets are shared, so
+    the configured rate is a global budget across all distributed workers.
+    """
+
+    def __init__(self, requests_per_second: float = 0.5, burst: int = 1,
+                 backoff_seconds: float = 30, max_backoff_seconds: float = 600, budget_store=None):
+        if not requests_per_second or requests_per_second <= 0:
+            raise ValueError(f"scraper.rate_limit.requests_per_second must be positive, got {requests_per_second!r}")
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.budget_store = budget_store
+        self.buckets = {}
+        self.strikes = {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict, budget_store=None) -> 'RateLimiter':
+        rate_config = config['scraper'].get('rate_limit', {})
+        return cls(
+            requests_per_second=rate_config.get('requests_per_second', 0.5),
+            burst=rate_config.get('burst', 1),
+            backoff_seconds=rate_config.get('backoff_seconds', 30),
+            max_backoff_seconds=rate_config.get('max_backoff_seconds', 600),
+            budget_store=budget_store
+        )
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self.lock:
+            if host not in self.buckets:
+                if self.budget_store is not None:
+                    self.buckets[host] = SharedTokenBucket(self.budget_store, host, self.requests_per_second, self.burst)
+                else:
+                    self.buckets[host] = TokenBucket(self.requests_per_second, self.burst)
+            return self.buckets[host]
+
+    def acquire(self, url: str):
+        self._bucket(urlparse(url).netloc).acquire()
+
+    def record_success(self, url: str):
+        with self.lock:
+            self.strikes.pop(urlparse(url).netloc, None)
+
+    def backoff(self, url: str, retry_after: float = None):
+        """Pause all requests to the url's host after a throttling response."""
+        host = urlparse(url).netloc
+        with self.lock:
+            strikes = self.strikes.get(host, 0) + 1
+            self.strikes[host] = strikes
+        if retry_after is None:
+            # Double the pause for every consecutive throttle without a server hint
+            retry_after = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (strikes - 1))
+        logger.warning(f"Throttled by {host}, pausing requests for {retry_after:.1f}s")
+        self._bucket(host).pause(retry_after)
@@ -0,0 +1,96 @@
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+
+logger = logging.getLogger(__name__)
+
+class DescriptionCache:
+    """On-disk, zlib-compressed cache of job descriptions keyed by LinkedIn job ID.
+
+    Entries older than `ttl_seconds` are ignored and dropped on read. When the
+    compressed total exceeds `max_bytes`, least recently used entries are
+    evicted until it is back under 90% of the limit.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 30 * 86400, max_bytes: int = 200 * 1024 * 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS descriptions (
+                job_id TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_descriptions_accessed ON descriptions (accessed_at)")
+        self.conn.commit()
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM descriptions").fetchone()[0]
+
+    @classmethod
+    def from_config(cls, config: dict):
+        """Build the cache from scraper.cache, or return None when it is disabled."""
+        cache_config = config['scraper'].get('cache', {})
+        if not cache_config.get('enabled', False):
+            return None
+        return cls(
+            cache_config.get('path', 'description_cache.db'),
+            ttl_seconds=cache_config.get('ttl_days', 30) * 86400,
+            max_bytes=int(cache_config.get('max_size_mb', 200) * 1024 * 1024)
+        )
+
+    def get(self, job_id: str) -> str:
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT body, size, fetched_at FROM descriptions WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            body, size, fetched_at = row
+            if now - fetched_at > self.ttl_seconds:
+                self.conn.execute("DELETE FROM descriptions WHERE job_id = ?", (job_id,))
+                self.conn.commit()
+                self.total_bytes -= size
+                return None
+            self.conn.execute("UPDATE descriptions SET accessed_at = ? WHERE job_id = ?", (now, job_id))
+            self.conn.commit()
+        return zlib.decompress(body).decode('utf-8')
+
+    def put(self, job_id: str, description: str):
+        body = zlib.compress(description.encode('utf-8'))
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute("SELECT size FROM descriptions WHERE job_id = ?", (job_id,)).fetchone()
+            if row:
+                self.total_bytes -= row[0]
+            self.conn.execute(
+                "INSERT OR REPLACE INTO descriptions (job_id, body, size, fetched_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, body, len(body), now, now)
+            )
+            self.total_bytes += len(body)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        target = self.max_bytes * 0.9
+        evicted = 0
+        rows = self.conn.execute("SELECT job_id, size FROM descriptions ORDER BY accessed_at").fetchall()
+        for job_id, size in rows:
+            if self.total_bytes <= target:
+                break
+            self.conn.execute("DELETE FROM descriptions WHERE job_id = ?", (job_id,))
+            self.total_bytes -= size
+            evicted += 1
+        logger.info(f"Evicted {evicted} cached descriptions, {self.total_bytes} bytes remain")
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
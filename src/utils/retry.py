@@ -0,0 +1,48 @@
+import logging
+import random
+import time
+import requests
+from .rate_limiter import THROTTLE_STATUS_CODES
+
+logger = logging.getLogger(__name__)
+
+class RetryPolicy:
+    """Retry transient fetch failures with exponential backoff and full jitter."""
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 1.0, max_delay: float = 60.0):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'RetryPolicy':
+        retry_config = config['scraper'].get('retry', {})
+        return cls(
+            max_attempts=retry_config.get('max_attempts', 4),
+            base_delay=retry_config.get('base_delay', 1.0),
+            max_delay=retry_config.get('max_delay', 60.0)
+        )
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """Only timeouts, dropped connections, 5xx and throttling are worth retrying."""
+        if isinstance(error, (requests.Timeout, requests.ConnectionError)):
+            return True
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            status = error.response.status_code
+            return status >= 500 or status in THROTTLE_STATUS_CODES
+        return False
+
+    def backoff_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def call(self, func, *args, **kwargs):
+        for attempt in range(self.max_attempts):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt == self.max_attempts - 1 or not self.is_retryable(e):
+                    raise
+                delay = self.backoff_delay(attempt)
+                logger.warning(f"Attempt {attempt + 1}/{self.max_attempts} failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
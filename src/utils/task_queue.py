@@ -0,0 +1,393 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from collections import namedtuple
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# `lease` identifies one lease of the task; ack and fail only act while it is still the current one
+Task = namedtuple('Task', ['id', 'kind', 'payload', 'attempts', 'lease'], defaults=[None])
+
+def new_lease(worker_id: str) -> str:
+    return f"{worker_id}/{uuid.uuid4().hex}"
+
+class SQLiteTaskQueue:
+    """Crawl task queue, result store and rate budget in one SQLite file.
+
+    Any number of worker processes on the same machine (or on a shared
+    volume) can open the same file. A leased task is invisible to other
+    workers until it is acknowledged, failed, or its lease expires, so work
+    held by a crashed worker is picked up again. An expired lease counts as
+    a failed attempt, so a task that keeps crashing workers still ends up
+    failed. Once another worker has leased it, the late acknowledgement or
+    failure of the first is ignored. Tasks enqueued with a `key` are only
+    ever enqueued once.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 120, max_attempts: int = 3):
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                task_key TEXT UNIQUE,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_until REAL,
+                worker TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, lease_until);
+            CREATE TABLE IF NOT EXISTS results (
+                result_key TEXT PRIMARY KEY,
+                row TEXT NOT NULL,
+                stored_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS rate_budget (
+                host TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated REAL NOT NULL,
+                blocked_until REAL NOT NULL DEFAULT 0
+            );
+        """)
+
+    def _transaction(self, func):
+        # BEGIN IMMEDIATE takes the write lock up front, so concurrent workers serialize here
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = func()
+                self.conn.execute("COMMIT")
+                return result
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def put(self, kind: str, payload: dict, key: str = None) -> bool:
+        """Enqueue a task; return False if a task with the same key already exists."""
+        with self.lock:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO tasks (kind, payload, task_key) VALUES (?, ?, ?)",
+                (kind, json.dumps(payload), key)
+            )
+        return cursor.rowcount > 0
+
+    def lease(self, worker_id: str) -> Task:
+        """Take the oldest available task for `lease_seconds`, or return None."""
+        def take():
+            now = time.time()
+            while True:
+                row = self.conn.execute(
+                    "SELECT id, kind, payload, attempts, status FROM tasks "
+                    "WHERE status = 'pending' OR (status = 'leased' AND lease_until < ?) "
+                    "ORDER BY id LIMIT 1", (now,)
+                ).fetchone()
+                if row is None:
+                    return None
+                task_id, kind, payload, attempts, status = row
+                if status == 'leased':
+                    attempts += 1
+                    if attempts >= self.max_attempts:
+                        self.conn.execute(
+                            "UPDATE tasks SET status = 'failed', attempts = ?, lease_until = NULL WHERE id = ?",
+                            (attempts, task_id)
+                        )
+                        logger.warning(f"Task {task_id} ({kind}) failed: lease expired on attempt {attempts}")
+                        continue
+                lease = new_lease(worker_id)
+                self.conn.execute(
+                    "UPDATE tasks SET status = 'leased', attempts = ?, lease_until = ?, worker = ? WHERE id = ?",
+                    (attempts, now + self.lease_seconds, lease, task_id)
+                )
+                return Task(task_id, kind, json.loads(payload), attempts, lease)
+        return self._transaction(take)
+
+    def ack(self, task: Task) -> bool:
+        """Mark a leased task done; return False if its lease has passed to another worker."""
+        with self.lock:
+            cursor = self.conn.execute(
+                "UPDATE tasks SET status = 'done', lease_until = NULL WHERE id = ? AND status = 'leased' AND worker = ?",
+                (task.id, task.lease)
+            )
+        if not cursor.rowcount:
+            logger.warning(f"Task {task.id} ({task.kind}) was leased again before it was acknowledged")
+        return cursor.rowcount > 0
+
+    def fail(self, task: Task, reason: str = '') -> bool:
+        """Release a task for another attempt; return False once it has run out of attempts.
+
+        A task whose lease has passed to another worker is left to that worker.
+        """
+        attempts = task.attempts + 1
+        status = 'pending' if attempts < self.max_attempts else 'failed'
+        with self.lock:
+            cursor = self.conn.execute(
+                "UPDATE tasks SET status = ?, attempts = ?, lease_until = NULL "
+                "WHERE id = ? AND status = 'leased' AND worker = ?",
+                (status, attempts, task.id, task.lease)
+            )
+        if not cursor.rowcount:
+            logger.warning(f"Task {task.id} ({task.kind}) failed after it was leased again: {reason}")
+            return True
+        logger.warning(f"Task {task.id} ({task.kind}) failed on attempt {attempts}: {reason}")
+        return status == 'pending'
+
+    def counts(self) -> dict:
+        with self.lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        return dict(rows)
+
+    def put_result(self, key: str, row: list):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO results (result_key, row, stored_at) VALUES (?, ?, ?)",
+                (key, json.dumps(row), time.time())
+            )
+
+    def iter_results(self):
+        with self.lock:
+            rows = self.conn.execute("SELECT row FROM results ORDER BY stored_at").fetchall()
+        for (row,) in rows:
+            yield json.loads(row)
+
+    def take_token(self, host: str, rate: float, burst: int) -> float:
+        """Spend one token of the shared budget for `host`; return 0, or the seconds to wait."""
+        def take():
+            now = time.time()
+            row = self.conn.execute(
+                "SELECT tokens, updated, blocked_until FROM rate_budget WHERE host = ?", (host,)
+            ).fetchone()
+            tokens, updated, blocked_until = row if row else (float(burst), now, 0.0)
+            # Nothing refills during a pause, so the budget starts empty when it lifts
+            tokens = min(burst, tokens + max(0.0, now - max(updated, blocked_until)) * rate)
+            if now < blocked_until:
+                wait = blocked_until - now
+            elif tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / rate
+            self.conn.execute(
+                "INSERT OR REPLACE INTO rate_budget (host, tokens, updated, blocked_until) VALUES (?, ?, ?, ?)",
+                (host, tokens, now, blocked_until)
+            )
+            return wait
+        return self._transaction(take)
+
+    def pause(self, host: str, seconds: float):
+        """Block every worker's requests to `host` for `seconds`."""
+        def block():
+            until = time.time() + seconds
+            self.conn.execute(
+                "INSERT INTO rate_budget (host, tokens, updated, blocked_until) VALUES (?, 0, ?, ?) "
+                "ON CONFLICT(host) DO UPDATE SET tokens = 0, blocked_until = MAX(blocked_until, excluded.blocked_until)",
+                (host, time.time(), until)
+            )
+        self._transaction(block)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class RedisTaskQueue:
+    """The SQLiteTaskQueue interface on a Redis-compatible server, for workers on several machines.
+
+    Works with anything speaking the Redis protocol through redis-py
+    (Redis, Valkey, KeyDB, or a local stand-in). All keys live under `name`.
+    Enqueueing, leasing, acknowledging and failing each run as one Lua
+    script, so a worker dying midway cannot lose a task. As in the SQLite
+    queue, an expired lease counts as a failed attempt.
+    """
+
+    # KEYS: keys, seq, tasks, pending; ARGV: '1' if the task has a key, the key, task_json
+    PUT_SCRIPT = """
+        if ARGV[1] == '1' and redis.call('SADD', KEYS[1], ARGV[2]) == 0 then
+            return 0
+        end
+        local task_id = redis.call('INCR', KEYS[2])
+        redis.call('HSET', KEYS[3], task_id, ARGV[3])
+        redis.call('LPUSH', KEYS[4], task_id)
+        return 1
+    """
+
+    # KEYS: pending, leases, owners, tasks, stats; ARGV: now, lease_seconds, lease, max_attempts
+    LEASE_SCRIPT = """
+        for _, task_id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[2], 0, ARGV[1])) do
+            redis.call('ZREM', KEYS[2], task_id)
+            local task = cjson.decode(redis.call('HGET', KEYS[4], task_id))
+            task['attempts'] = task['attempts'] + 1
+            if task['attempts'] >= tonumber(ARGV[4]) then
+                redis.call('HDEL', KEYS[4], task_id)
+                redis.call('HDEL', KEYS[3], task_id)
+                redis.call('HINCRBY', KEYS[5], 'failed', 1)
+            else
+                redis.call('HSET', KEYS[4], task_id, cjson.encode(task))
+                redis.call('RPUSH', KEYS[1], task_id)
+            end
+        end
+        local task_id = redis.call('RPOP', KEYS[1])
+        if not task_id then
+            return false
+        end
+        redis.call('ZADD', KEYS[2], tonumber(ARGV[1]) + tonumber(ARGV[2]), task_id)
+        redis.call('HSET', KEYS[3], task_id, ARGV[3])
+        return {task_id, redis.call('HGET', KEYS[4], task_id)}
+    """
+
+    # KEYS: pending, leases, owners, tasks, stats
+    # ARGV: task_id, lease, task_json to requeue (or '' to finish), stats counter to bump when finished
+    # Returns -1 if the lease has passed to another worker, 0 once the task is finished, 1 if requeued
+    SETTLE_SCRIPT = """
+        if redis.call('HGET', KEYS[3], ARGV[1]) ~= ARGV[2] then
+            return -1
+        end
+        redis.call('ZREM', KEYS[2], ARGV[1])
+        redis.call('HDEL', KEYS[3], ARGV[1])
+        -- An expired lease may already have requeued the task
+        redis.call('LREM', KEYS[1], 0, ARGV[1])
+        if ARGV[3] == '' then
+            redis.call('HDEL', KEYS[4], ARGV[1])
+            redis.call('HINCRBY', KEYS[5], ARGV[4], 1)
+            return 0
+        end
+        redis.call('HSET', KEYS[4], ARGV[1], ARGV[3])
+        redis.call('LPUSH', KEYS[1], ARGV[1])
+        return 1
+    """
+
+    def __init__(self, client, name: str = 'linkedin', lease_seconds: float = 120, max_attempts: int = 3):
+        self.client = client
+        self.name = name
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.put_script = client.register_script(self.PUT_SCRIPT)
+        self.lease_script = client.register_script(self.LEASE_SCRIPT)
+        self.settle_script = client.register_script(self.SETTLE_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> 'RedisTaskQueue':
+        if redis is None:
+            raise ImportError("The redis queue backend needs the redis package (pip install redis)")
+        return cls(redis.Redis.from_url(url, decode_responses=True), **kwargs)
+
+    def _key(self, suffix: str) -> str:
+        return f"{self.name}:{suffix}"
+
+    def put(self, kind: str, payload: dict, key: str = None) -> bool:
+        """Enqueue a task; return False if a task with the same key already exists."""
+        task_json = json.dumps({'kind': kind, 'payload': payload, 'attempts': 0})
+        keys = [self._key('keys'), self._key('seq'), self._key('tasks'), self._key('pending')]
+        return bool(self.put_script(keys=keys, args=['0' if key is None else '1', key or '', task_json]))
+
+    def _settle_keys(self) -> list:
+        return [self._key('pending'), self._key('leases'), self._key('owners'), self._key('tasks'), self._key('stats')]
+
+    def lease(self, worker_id: str) -> Task:
+        lease = new_lease(worker_id)
+        leased = self.lease_script(keys=self._settle_keys(),
+                                   args=[time.time(), self.lease_seconds, lease, self.max_attempts])
+        if not leased:
+            return None
+        task_id, task_json = leased
+        task = json.loads(task_json)
+        return Task(int(task_id), task['kind'], task['payload'], task['attempts'], lease)
+
+    def ack(self, task: Task) -> bool:
+        """Mark a leased task done; return False if its lease has passed to another worker."""
+        settled = self.settle_script(keys=self._settle_keys(), args=[task.id, task.lease, '', 'done'])
+        if settled < 0:
+            logger.warning(f"Task {task.id} ({task.kind}) was leased again before it was acknowledged")
+        return settled >= 0
+
+    def fail(self, task: Task, reason: str = '') -> bool:
+        """Release a task for another attempt; return False once it has run out of attempts."""
+        attempts = task.attempts + 1
+        task_json = ''
+        if attempts < self.max_attempts:
+            task_json = json.dumps({'kind': task.kind, 'payload': task.payload, 'attempts': attempts})
+        settled = self.settle_script(keys=self._settle_keys(), args=[task.id, task.lease, task_json, 'failed'])
+        if settled < 0:
+            logger.warning(f"Task {task.id} ({task.kind}) failed after it was leased again: {reason}")
+            return True
+        logger.warning(f"Task {task.id} ({task.kind}) failed on attempt {attempts}: {reason}")
+        return settled > 0
+
+    def counts(self) -> dict:
+        counts = {
+            'pending': self.client.llen(self._key('pending')),
+            'leased': self.client.zcard(self._key('leases'))
+        }
+        counts.update({status: int(count) for status, count in self.client.hgetall(self._key('stats')).items()})
+        return {status: count for status, count in counts.items() if count}
+
+    def put_result(self, key: str, row: list):
+        self.client.hset(self._key('results'), key, json.dumps(row))
+
+    def iter_results(self):
+        for row in self.client.hvals(self._key('results')):
+            yield json.loads(row)
+
+    def take_token(self, host: str, rate: float, burst: int) -> float:
+        budget_key = self._key(f"budget:{host}")
+        with self.client.pipeline() as pipe:
+            while True:
+                try:
+                    # Optimistic transaction: retried if another worker touched the budget meanwhile
+                    pipe.watch(budget_key)
+                    state = pipe.hgetall(budget_key)
+                    now = time.time()
+                    tokens = float(state.get('tokens', burst))
+                    updated = float(state.get('updated', now))
+                    blocked_until = float(state.get('blocked_until', 0))
+                    tokens = min(burst, tokens + max(0.0, now - max(updated, blocked_until)) * rate)
+                    if now < blocked_until:
+                        wait = blocked_until - now
+                    elif tokens >= 1:
+                        tokens -= 1
+                        wait = 0.0
+                    else:
+                        wait = (1 - tokens) / rate
+                    pipe.multi()
+                    pipe.hset(budget_key, mapping={'tokens': tokens, 'updated': now, 'blocked_until': blocked_until})
+                    pipe.execute()
+                    return wait
+                except redis.WatchError:
+                    continue
+
+    def pause(self, host: str, seconds: float):
+        budget_key = self._key(f"budget:{host}")
+        until = time.time() + seconds
+        current = float(self.client.hget(budget_key, 'blocked_until') or 0)
+        self.client.hset(budget_key, mapping={'tokens': 0, 'blocked_until': max(current, until)})
+
+    def close(self):
+        self.client.close()
+
+def create_task_queue(config: dict):
+    """Open the queue backend named in distributed.backend (sqlite or redis)."""
+    queue_config = config.get('distributed', {})
+    options = {
+        'lease_seconds': queue_config.get('lease_seconds', 120),
+        'max_attempts': queue_config.get('max_attempts', 3)
+    }
+    backend = queue_config.get('backend', 'sqlite')
+    if backend == 'redis':
+        return RedisTaskQueue.from_url(
+            queue_config.get('redis_url', 'redis://localhost:6379/0'),
+            name=queue_config.get('queue_name', 'linkedin'), **options
+        )
+    if backend != 'sqlite':
+        raise ValueError(f"Unknown queue backend: {backend}")
+    return SQLiteTaskQueue(queue_config.get('path', 'crawl_queue.db'), **options)
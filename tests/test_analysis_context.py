@@ -0,0 +1,59 @@
+import gc
+import weakref
+import pandas as pd
+from data_processor import DataProcessor
+from src.utils.analysis_context import AnalysisContext
+
+def jobs_frame():
+    tech_stack = ['Python, SQL', 'Java', 'Python, Docker, SQL', 'Not specified']
+    return pd.DataFrame({
+        'job_title': ['Data Engineer'] * 4,
+        'location': ['Paris, France', 'Lyon, France', 'Paris, France', 'Nice, France'],
+        'tech_stack': tech_stack,
+        'technologies': [[tech.strip() for tech in stack.split(',')] for stack in tech_stack],
+    })
+
+def test_identical_copies_share_a_context():
+    df = jobs_frame()
+    assert AnalysisContext.for_frame(df) is AnalysisContext.for_frame(df.copy())
+
+def test_context_does_not_pin_the_frame():
+    df = jobs_frame()
+    frame_ref = weakref.ref(df)
+    context = AnalysisContext.for_frame(df)
+    del df
+    gc.collect()
+    assert frame_ref() is None
+    assert context.tech_counts['Python'] == 2
+
+def test_edits_after_lookup_do_not_leak_into_the_context():
+    df = jobs_frame()
+    context = AnalysisContext.for_frame(df)
+    expected = context.cities.tolist()
+    df['technologies'][0].append('Rust')
+    df.loc[0, 'location'] = 'Berlin, Germany'
+    assert 'Rust' not in context.tech_counts
+    assert context.cities.tolist() == expected
+    assert context.techs_per_job.tolist() == [2, 1, 3, 1]
+
+def test_changed_tech_stack_gets_its_own_context():
+    df = jobs_frame()
+    changed = df.copy()
+    changed.loc[1, 'tech_stack'] = 'Java, Spring'
+    changed.at[1, 'technologies'] = ['Java', 'Spring']
+    assert AnalysisContext.for_frame(changed) is not AnalysisContext.for_frame(df)
+    assert AnalysisContext.for_frame(changed).tech_counts['Spring'] == 1
+
+def test_relabelled_frame_gets_its_own_context():
+    df = jobs_frame()
+    df['date_posted'] = ['2024-01-01', '2024-01-01', '2024-01-02', '2024-01-02']
+    relabelled = df.set_axis([10, 11, 12, 13])
+    assert AnalysisContext.for_frame(relabelled) is not AnalysisContext.for_frame(df)
+    expected = DataProcessor.analyze_time_trends(df)['tech_trends']
+    assert DataProcessor.analyze_time_trends(relabelled)['tech_trends'].tolist() == expected.tolist() == [3, 4]
+
+def test_lists_edited_apart_from_tech_stack_are_counted():
+    df = jobs_frame()
+    assert 'Rust' not in AnalysisContext.for_frame(df).tech_counts
+    df['technologies'][0].append('Rust')
+    assert AnalysisContext.for_frame(df).tech_counts['Rust'] == 1
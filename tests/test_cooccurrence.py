@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+from data_processor import DataProcessor
+from src.utils.cooccurrence import TechCooccurrence
+from src.utils.job_store import JobStore
+
+COLUMNS = ['job_title', 'company', 'location', 'job_link', 'job_description', 'tech_stack']
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.db'), COLUMNS)
+    yield store
+    store.close()
+
+def write_jobs(store, tech_stacks):
+    for i, tech_stack in enumerate(tech_stacks):
+        store.writerow(['Engineer', f'Company {i % 2}', 'Pune, India',
+                        f'https://www.linkedin.com/jobs/view/{1000000 + i}', '', tech_stack])
+    store.flush()
+
+def test_store_kpis_on_an_empty_store(store):
+    kpis = DataProcessor.calculate_kpis_from_store(store)
+    assert kpis['tech_clustering'] == []
+    assert kpis['skill_correlation'].empty
+
+def test_store_kpis_with_only_single_tech_jobs(store):
+    write_jobs(store, ['Java', 'Python', 'Not specified'])
+    assert DataProcessor.calculate_kpis_from_store(store)['tech_clustering'] == []
+
+def test_store_kpis_with_a_tech_filter_leaving_no_pairs(store):
+    write_jobs(store, ['Java', 'Python, Spark', 'Python, Spark', 'Python, Spark, AWS'])
+    kpis = DataProcessor.calculate_kpis_from_store(store, techs=['Java'])
+    assert kpis['tech_clustering'] == []
+    assert kpis['tech_demand'].to_dict() == {'Java': 1}
+
+def test_store_and_frame_give_the_same_pairs_and_clusters(store):
+    tech_stacks = ['Python, Spark', 'Python, Spark, AWS', 'Python, Spark', 'Java, Spring', 'Java, Spring', 'AWS']
+    write_jobs(store, tech_stacks)
+    df = pd.DataFrame({'technologies': [[tech.strip() for tech in stack.split(',')] for stack in tech_stacks]})
+    from_frame = TechCooccurrence.from_frame(df)
+    from_store = TechCooccurrence.from_pair_counts(store.tech_pairs(), store.tech_demand())
+    assert from_store.pair_counts().sort_index().to_dict() == from_frame.pair_counts().sort_index().to_dict()
+    assert from_store.communities(min_weight=2) == from_frame.communities(min_weight=2)
+    assert sorted(map(sorted, from_frame.communities(min_weight=2))) == [['Java', 'Spring'], ['Python', 'Spark']]
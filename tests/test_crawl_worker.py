@@ -0,0 +1,55 @@
+import os
+import yaml
+from src.scrapers.crawl_worker import CrawlWorker
+from src.utils.job_index import JobIndex
+from src.utils.task_queue import SQLiteTaskQueue
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
+
+JOB_IDS = [str(3900000000 + i) for i in range(5)]
+
+CARD = """
+<div class="base-card">
+  <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/data-engineer-{job_id}"></a>
+  <h3 class="base-search-card__title">Data Engineer</h3>
+  <h4 class="base-search-card__subtitle">Acme</h4>
+  <span class="job-search-card__location">Pune, Maharashtra, India</span>
+  <time>1 day ago</time>
+</div>
+"""
+
+class FakeResponse:
+    status_code = 200
+    text = '<html><body>' + ''.join(CARD.format(job_id=job_id) for job_id in JOB_IDS) + '</body></html>'
+
+    def raise_for_status(self):
+        pass
+
+def test_workers_share_a_job_index_filled_by_an_earlier_run(tmp_path, monkeypatch):
+    with open(CONFIG_PATH) as f:
+        config = yaml.safe_load(f)
+    config['scraper']['rate_limit']['requests_per_second'] = 1000
+    monkeypatch.chdir(tmp_path)
+    earlier = JobIndex(config['scraper']['job_index']['path'])
+    for job_id in JOB_IDS:
+        earlier.add(job_id)
+    earlier.close()
+
+    queues, workers = [], []
+    for worker_id in ('worker-a', 'worker-b'):
+        task_queue = SQLiteTaskQueue(config['distributed']['path'])
+        worker = CrawlWorker(config, task_queue, worker_id)
+        monkeypatch.setattr(worker.scraper.http_client, 'get', lambda url, **kwargs: FakeResponse())
+        queues.append(task_queue)
+        workers.append(worker)
+    # Each worker has its own connection to the index; the busy timeout keeps a lock from stalling the test
+    for worker in workers:
+        worker.scraper.job_index.conn.execute("PRAGMA busy_timeout = 200")
+
+    try:
+        for page, worker in enumerate(workers + workers):
+            assert worker._handle_page({'keywords': 'Data Engineer', 'location': 'Pune', 'page': page})
+    finally:
+        for worker, task_queue in zip(workers, queues):
+            worker.scraper.close()
+            task_queue.close()
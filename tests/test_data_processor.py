@@ -0,0 +1,25 @@
+import pandas as pd
+import pytest
+from app import validate_data
+from data_processor import DataProcessor
+
+@pytest.mark.parametrize('headers', [
+    ['job_title', 'company_name', 'location', 'tech_stack'],
+    ['Job_Title', 'Company_Name', 'Location', 'Tech_Stack'],
+    ['job_title', 'company', 'location', 'tech_stack'],
+])
+def test_uploads_the_dashboard_accepts_still_validate(tmp_path, headers):
+    path = tmp_path / 'jobs.csv'
+    pd.DataFrame([['Data Engineer', 'Acme', 'Pune, India', 'Python, Spark']], columns=headers).to_csv(path, index=False)
+    df = DataProcessor.read_columns(str(path))
+    assert validate_data(df) == (True, "")
+    assert df['company'].tolist() == ['Acme']
+
+def test_links_and_descriptions_are_not_read(tmp_path):
+    path = tmp_path / 'jobs.csv'
+    pd.DataFrame({
+        'Job Title': ['Data Engineer'], 'Company Name': ['Acme'], 'location': ['Pune, India'],
+        'job_link': ['[Job Link](https://www.linkedin.com/jobs/view/3900000000)'],
+        'job_description': ['[Job Description](job_descriptions.db#3900000000)'], 'Skills': ['Python'],
+    }).to_csv(path, index=False)
+    assert DataProcessor.read_columns(str(path)).columns.tolist() == ['Job Title', 'Company Name', 'location', 'Skills']
@@ -0,0 +1,114 @@
+import pytest
+from src.scrapers.job_description_scraper import JobDescriptionScraper
+from src.utils.html_parser import available_backends, parse_html, stream_section_text
+
+LINKEDIN_JOB_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <title>Data Engineer - Acme - LinkedIn</title>
+  <script type="application/ld+json">{"description": "Python Spark &amp; more"}</script>
+  <style>.description__text { color: red; }</style>
+</head>
+<body>
+  <section class="top-card-layout">
+    <h1 class="top-card-layout__title">Data Engineer</h1>
+    <a class="topcard__org-name-link" href="/company/acme">Acme</a>
+    <span class="topcard__flavor topcard__flavor--bullet">Bengaluru, Karnataka, India</span>
+  </section>
+  <div class="decorated-job-posting__details">
+    <section class="core-section-container my-3 description">
+      <div class="core-section-container__content break-words">
+        <div class="description__text description__text--rich">
+          <section class="show-more-less-html" data-max-lines="5">
+            <div class="show-more-less-html__markup show-more-less-html__markup--clamp-after-5">
+              <strong>About the role</strong><br><br>
+              We need <b>Python</b> and Spark.<br>
+              <ul><li>Build pipelines on AWS<li>Own Kafka &amp; Airflow jobs</ul>
+              <p>Nice to have: Go, Kubernetes
+              <script>window.trk = "Java";</script>
+            </div>
+            <button class="show-more-less-html__button">Show more</button>
+          </section>
+        </div>
+        <ul class="description__job-criteria-list">
+          <li class="description__job-criteria-item">
+            <h3 class="description__job-criteria-subheader">Seniority level</h3>
+            <span class="description__job-criteria-text">Mid-Senior level</span>
+          </li>
+        </ul>
+      </div>
+    </section>
+  </div>
+  <section class="similar-jobs"><div class="job-description">Unrelated Java role</div></section>
+  <footer>""" + "<p>footer padding</p>" * 2000 + """</footer>
+</body>
+</html>"""
+
+class FakeStreamResponse:
+    """Stands in for a streamed requests.Response, recording how much was read."""
+
+    def __init__(self, body: str, encoding: str = 'utf-8'):
+        self.body = body.encode(encoding)
+        self.encoding = encoding
+        self.bytes_read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.body), chunk_size):
+            chunk = self.body[start:start + chunk_size]
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+def buffered_description(markup: str, backend: str) -> str:
+    document = parse_html(markup, backend)
+    for selector in JobDescriptionScraper.DESCRIPTION_SELECTORS:
+        element = document.select_one(selector)
+        if element:
+            return element.text()
+    return None
+
+def streamed_description(markup: str, chunk_size: int = 7, drain_limit: int = 0):
+    response = FakeStreamResponse(markup)
+    text = stream_section_text(
+        response, JobDescriptionScraper.DESCRIPTION_CONTAINERS, chunk_size=chunk_size, drain_limit=drain_limit
+    )
+    return text, response
+
+@pytest.mark.parametrize('backend', available_backends())
+@pytest.mark.parametrize('chunk_size', [1, 7, 16384])
+def test_streamed_description_matches_buffered_parse(backend, chunk_size):
+    text, response = streamed_description(LINKEDIN_JOB_PAGE, chunk_size)
+    assert text == buffered_description(LINKEDIN_JOB_PAGE, backend)
+    assert 'Seniority level' not in text and 'Java' not in text
+    assert response.closed
+
+def test_streaming_stops_reading_after_the_description():
+    text, response = streamed_description(LINKEDIN_JOB_PAGE, chunk_size=1024)
+    assert response.bytes_read < len(response.body) / 2
+
+def test_short_remainder_is_drained_to_keep_the_connection():
+    page = LINKEDIN_JOB_PAGE.split('<footer>')[0] + '</body></html>'
+    text, response = streamed_description(page, chunk_size=64, drain_limit=65536)
+    assert response.bytes_read == len(response.body)
+    assert text == buffered_description(page, 'html.parser')
+
+@pytest.mark.parametrize('markup', [
+    '<section class="core-section-container description"><div class="description__text">We need Python and Spark.'
+    ' <button>Show more</button></div><ul class="description__job-criteria-list"><li>Seniority level Mid-Senior</li>'
+    '</ul></section>',
+    '<section class="x description"><p>Only the section</p><ul><li>Criteria</li></ul></section>',
+    '<div class="job-description">Plain</div><section class="description"><p>Later section</p></section>',
+    '<section class="description"><div class="job-description">Inner <b>text</b></div> outer</section>',
+    '<div class="description__text">Outer <div class="show-more-less-html__markup">Markup</div> tail</div>',
+])
+def test_selector_priority_matches_buffered_parse(markup):
+    text, _ = streamed_description(markup, chunk_size=5)
+    assert text == buffered_description(markup, 'html.parser')
+
+def test_page_without_description_container():
+    text, _ = streamed_description('<html><body><p>Nothing here</p></body></html>')
+    assert text is None
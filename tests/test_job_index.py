@@ -0,0 +1,45 @@
+from src.utils.job_index import JobIndex
+from src.utils.pagination import PaginationTracker
+from src.scrapers.linkedin_scraper import SearchPage
+
+def test_ids_added_this_run_are_not_known(tmp_path):
+    path = str(tmp_path / 'index.db')
+    earlier = JobIndex(path)
+    earlier.add('1')
+    earlier.close()
+
+    index = JobIndex(path)
+    # Another search of the same sweep fetched these first
+    index.add('2')
+    index.add('3')
+    index.flush()
+    assert index.known(['1', '2', '3', '4']) == {'1'}
+    assert len(index) == 3
+    index.close()
+
+    # The next run treats them as known
+    later = JobIndex(path)
+    assert later.known(['1', '2', '3', '4']) == {'1', '2', '3'}
+    later.close()
+
+def test_readding_an_earlier_id_keeps_it_known(tmp_path):
+    path = str(tmp_path / 'index.db')
+    earlier = JobIndex(path)
+    earlier.add('1')
+    earlier.close()
+
+    index = JobIndex(path)
+    index.add('1')
+    assert index.known(['1']) == {'1'}
+    index.close()
+
+def test_sweep_does_not_stop_on_postings_from_parallel_searches(tmp_path):
+    index = JobIndex(str(tmp_path / 'index.db'))
+    card_ids = [str(job_id) for job_id in range(10)]
+    for job_id in card_ids:
+        index.add(job_id)
+
+    tracker = PaginationTracker(jobs_per_page=10, stop_after_known=5)
+    search_page = SearchPage(len(card_ids), [], None, card_ids, index.known(card_ids))
+    assert tracker.stop_reason(0, search_page) is None
+    index.close()
@@ -0,0 +1,51 @@
+import csv
+import os
+import sqlite3
+import yaml
+from src.scrapers.linkedin_scraper import LinkedInScraper
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
+
+def durable_counts():
+    """What another process would find on disk right now."""
+    with open('job_listings.csv', newline='', encoding='utf-8') as f:
+        csv_rows = max(0, sum(1 for _ in csv.reader(f)) - 1)
+    counts = {'csv': csv_rows}
+    for name, path, table in [('descriptions', 'job_descriptions.db', 'job_blobs'), ('index', 'job_index.db', 'jobs_seen')]:
+        conn = sqlite3.connect(path)
+        try:
+            counts[name] = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        finally:
+            conn.close()
+    return counts
+
+def test_page_checkpoint_follows_durable_rows_and_stores(tmp_path, monkeypatch):
+    with open(CONFIG_PATH) as f:
+        config = yaml.safe_load(f)
+    # Every relative output path lands in the test directory
+    monkeypatch.chdir(tmp_path)
+    scraper = LinkedInScraper(config)
+    scraper._prepare_checkpoint(resume=False)
+    writer = scraper._open_output(append=False)
+
+    seen_at_commit = []
+    commit = scraper.checkpoint.commit
+    def checked_commit(query=None, start=None):
+        seen_at_commit.append(durable_counts())
+        commit(query, start)
+    monkeypatch.setattr(scraper.checkpoint, 'commit', checked_commit)
+
+    try:
+        for i in range(3):
+            job_id = str(3900000000 + i)
+            job_data = {'job_id': job_id, 'job_title': f'Data Engineer {i}', 'company': 'Acme',
+                        'location': 'Pune, Maharashtra, India', 'job_link': f'https://www.linkedin.com/jobs/view/{job_id}'}
+            assert scraper._record_job(writer, job_data, f'Spark and Python pipelines, team {i}', f'{i + 1}/3')
+        # Everything is still batched in memory
+        assert durable_counts() == {'csv': 0, 'descriptions': 0, 'index': 0}
+
+        scraper._commit_page(writer, 'Data Engineer | Pune', 0)
+        assert seen_at_commit == [{'csv': 3, 'descriptions': 3, 'index': 3}]
+    finally:
+        writer.close()
+        scraper.close()
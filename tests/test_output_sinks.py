@@ -0,0 +1,67 @@
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from data_processor import DataProcessor
+from src.utils.description_store import DescriptionStore
+from src.utils.output_sinks import create_sinks
+
+COLUMNS = ['job_title', 'company', 'location', 'job_link', 'job_description', 'tech_stack']
+
+@pytest.fixture
+def config(tmp_path):
+    return {'output': {
+        'file': str(tmp_path / 'jobs.csv'),
+        'columns': COLUMNS,
+        'buffer': {'batch_size': 2, 'flush_interval_seconds': 60, 'fsync_interval_seconds': 0},
+        'parquet': {'enabled': True, 'file': str(tmp_path / 'jobs.parquet'), 'row_group_size': 3},
+    }}
+
+@pytest.fixture
+def store(tmp_path):
+    store = DescriptionStore(str(tmp_path / 'descriptions.db'), batch_size=2)
+    yield store
+    store.close()
+
+def write_job(writer, store, i, tech_stack='Python, Spark'):
+    job_id = str(1000000 + i)
+    store.put(job_id, f"Description of job {i} with {tech_stack}")
+    writer.writerow([f'Engineer {i}', 'Acme', 'Pune, India', f'https://www.linkedin.com/jobs/view/{job_id}',
+                     f'[Job Description]({store.link(job_id)})', tech_stack])
+
+def test_parquet_matches_the_csv_after_a_crash_and_resume(config, store):
+    crashed = create_sinks(config, stores=[store])
+    for i in range(5):
+        write_job(crashed, store, i)
+    crashed.flush()
+    # The run dies here: nothing is closed, only the page-level flush happened
+
+    with create_sinks(config, append=True, stores=[store]) as writer:
+        for i in range(5, 8):
+            write_job(writer, store, i)
+
+    csv_rows = pd.read_csv(config['output']['file'], dtype=str)
+    table = pq.ParquetFile(config['output']['parquet']['file'])
+    assert table.metadata.num_rows == len(csv_rows) == 8
+    assert table.metadata.row_group(0).num_rows == 3
+    parquet_rows = table.read().to_pandas()
+    assert parquet_rows['job_link'].tolist() == csv_rows['job_link'].tolist()
+    assert parquet_rows['job_description'].iloc[6] == 'Description of job 6 with Python, Spark'
+
+def test_parquet_and_csv_give_the_same_kpis(config, store):
+    with create_sinks(config, stores=[store]) as writer:
+        for i, tech_stack in enumerate(['Python, Spark', 'Not specified', 'Java', 'Python, AWS', 'Not specified']):
+            write_job(writer, store, i, tech_stack)
+
+    from_csv = DataProcessor.load_data(config['output']['file'])
+    from_parquet = DataProcessor.load_data(config['output']['parquet']['file'])
+    assert list(from_parquet['technologies'].iloc[1]) == ['Not specified'] == from_csv['technologies'].iloc[1]
+    csv_kpis, parquet_kpis = DataProcessor.calculate_kpis(from_csv), DataProcessor.calculate_kpis(from_parquet)
+    assert csv_kpis['tech_demand'].sort_index().to_dict() == parquet_kpis['tech_demand'].sort_index().to_dict()
+    assert csv_kpis['rare_skills'] == parquet_kpis['rare_skills']
+
+def test_parquet_without_a_description_store_keeps_the_links(config, store):
+    with create_sinks(config) as writer:
+        write_job(writer, store, 0)
+    row = pq.read_table(config['output']['parquet']['file']).to_pylist()[0]
+    assert row['job_description'] == f'[Job Description]({store.link("1000000")})'
+    assert row['technologies'] == ['Python', 'Spark']
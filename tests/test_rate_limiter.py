@@ -0,0 +1,61 @@
+import pytest
+from src.utils import rate_limiter
+from src.utils.rate_limiter import RateLimiter, TokenBucket
+from src.utils.task_queue import SQLiteTaskQueue
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, 'time', clock)
+    return clock
+
+def request_times(bucket, clock, count):
+    times = []
+    for _ in range(count):
+        bucket.acquire()
+        times.append(clock.now)
+    return times
+
+def test_no_burst_when_a_pause_lifts(clock):
+    bucket = TokenBucket(rate=1.0, burst=5)
+    bucket.pause(30)
+    clock.now += 10
+    times = request_times(bucket, clock, 3)
+    # Refilling starts when the pause ends, one token per second
+    assert times == [1031.0, 1032.0, 1033.0]
+
+def test_full_burst_is_available_without_a_pause(clock):
+    bucket = TokenBucket(rate=1.0, burst=3)
+    assert request_times(bucket, clock, 4) == [1000.0, 1000.0, 1000.0, 1001.0]
+
+def test_shared_budget_does_not_refill_while_paused(tmp_path, monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr('src.utils.task_queue.time', clock)
+    queue = SQLiteTaskQueue(str(tmp_path / 'queue.db'))
+    try:
+        queue.pause('www.linkedin.com', 30)
+        clock.now += 10
+        assert queue.take_token('www.linkedin.com', 1.0, 5) == 20.0
+        # Half a second after the pause lifts there is half a token, not a full burst
+        clock.now += 20.5
+        assert queue.take_token('www.linkedin.com', 1.0, 5) == pytest.approx(0.5)
+    finally:
+        queue.close()
+
+@pytest.mark.parametrize('rate', [0, -1])
+def test_non_positive_rate_is_rejected(rate):
+    with pytest.raises(ValueError):
+        RateLimiter.from_config({'scraper': {'rate_limit': {'requests_per_second': rate}}})
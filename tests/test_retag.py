@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+from main import retag_csv
+from src.utils.description_store import DescriptionStore
+
+def test_retag_without_description_column_exits_with_message(tmp_path):
+    path = tmp_path / 'jobs.csv'
+    pd.DataFrame({'job_title': ['Data Engineer'], 'tech_stack': ['Python']}).to_csv(path, index=False)
+    with pytest.raises(SystemExit, match='no job_description column'):
+        retag_csv(str(path), config={})
+    # The file is left untouched
+    assert pd.read_csv(path).columns.tolist() == ['job_title', 'tech_stack']
+
+def test_retag_recomputes_tech_stack(tmp_path):
+    path = tmp_path / 'jobs.csv'
+    pd.DataFrame({'Job Description': ['We use Python and Docker daily.']}).to_csv(path, index=False)
+    retag_csv(str(path), config={}, processes=1)
+    df = pd.read_csv(path)
+    assert 'Python' in df['tech_stack'][0]
+
+def linked_frame(job_ids):
+    return pd.DataFrame({
+        'job_description': [f'[Job Description](job_descriptions.db#{job_id})' for job_id in job_ids],
+        'tech_stack': ['Python, Spark'] * len(job_ids),
+    })
+
+def test_retag_reads_linked_descriptions_and_keeps_unresolved_tags(tmp_path):
+    store_path = tmp_path / 'job_descriptions.db'
+    store = DescriptionStore(str(store_path))
+    store.put('3900000001', 'Kafka and Java services')
+    store.close()
+    path = tmp_path / 'jobs.csv'
+    linked_frame(['3900000001', '3900000002']).to_csv(path, index=False)
+
+    retag_csv(str(path), config={'output': {'description_store': str(store_path)}}, processes=1)
+    tech_stacks = pd.read_csv(path)['tech_stack'].tolist()
+    assert 'Kafka' in tech_stacks[0] and 'Python' not in tech_stacks[0]
+    # Not in the store: the row keeps the tags it had
+    assert tech_stacks[1] == 'Python, Spark'
+
+def test_retag_refuses_a_missing_description_store(tmp_path):
+    store_path = tmp_path / 'elsewhere.db'
+    path = tmp_path / 'jobs.csv'
+    linked_frame(['3900000001']).to_csv(path, index=False)
+    with pytest.raises(SystemExit, match='does not exist'):
+        retag_csv(str(path), config={'output': {'description_store': str(store_path)}})
+    assert not store_path.exists()
+    assert pd.read_csv(path)['tech_stack'].tolist() == ['Python, Spark']
@@ -0,0 +1,92 @@
+import pytest
+from src.utils import task_queue
+from src.utils.task_queue import RedisTaskQueue, SQLiteTaskQueue
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(task_queue, 'time', clock)
+    return clock
+
+@pytest.fixture(params=['sqlite', 'redis'])
+def queue(request, tmp_path, clock):
+    if request.param == 'sqlite':
+        queue = SQLiteTaskQueue(str(tmp_path / 'queue.db'), lease_seconds=60, max_attempts=2)
+    else:
+        fakeredis = pytest.importorskip('fakeredis')
+        pytest.importorskip('lupa')
+        queue = RedisTaskQueue(fakeredis.FakeRedis(decode_responses=True), lease_seconds=60, max_attempts=2)
+    yield queue
+    queue.close()
+
+def test_lease_ack_round_trip(queue):
+    queue.put('job', {'job_id': '1'}, key='job|1')
+    assert not queue.put('job', {'job_id': '1'}, key='job|1')
+    task = queue.lease('worker-a')
+    assert task.payload == {'job_id': '1'}
+    assert queue.lease('worker-b') is None
+    assert queue.ack(task)
+    assert queue.lease('worker-b') is None
+    assert queue.counts() == {'done': 1}
+
+def test_expired_lease_passes_to_another_worker(queue, clock):
+    queue.put('job', {'job_id': '1'})
+    stale = queue.lease('worker-a')
+    clock.now += 61
+    current = queue.lease('worker-b')
+    assert current.id == stale.id
+
+    # The first worker's late outcome must not touch the second worker's lease
+    assert not queue.ack(stale)
+    assert queue.fail(stale, 'late')
+    assert queue.counts() == {'leased': 1}
+    assert queue.lease('worker-c') is None
+
+    assert queue.ack(current)
+    assert queue.counts() == {'done': 1}
+
+def test_late_ack_of_unclaimed_expired_lease_still_counts(queue, clock):
+    queue.put('job', {'job_id': '1'})
+    task = queue.lease('worker-a')
+    clock.now += 61
+    assert queue.ack(task)
+    assert queue.lease('worker-b') is None
+    assert queue.counts() == {'done': 1}
+
+def test_fail_requeues_until_attempts_run_out(queue):
+    queue.put('job', {'job_id': '1'})
+    task = queue.lease('worker-a')
+    assert queue.fail(task, 'timeout')
+    retry = queue.lease('worker-b')
+    assert retry.attempts == 1
+    assert not queue.fail(retry, 'timeout')
+    assert queue.lease('worker-c') is None
+    assert queue.counts() == {'failed': 1}
+
+def test_expired_leases_count_as_attempts(queue, clock):
+    queue.put('page', {'keywords': 'Data Engineer', 'page': 3, 'last_page': None})
+    first = queue.lease('worker-a')
+    clock.now += 61
+    # The worker crashed on it: the next lease is its second attempt
+    second = queue.lease('worker-b')
+    assert second.attempts == 1
+    assert second.payload == first.payload
+    clock.now += 61
+    # max_attempts is 2, so a second crash ends the task
+    assert queue.lease('worker-c') is None
+    assert queue.counts() == {'failed': 1}
+    assert not queue.ack(second)
+
+def test_put_reserves_each_key_once(queue):
+    assert queue.put('page', {'page': 0}, key='page|0')
+    assert not queue.put('page', {'page': 0}, key='page|0')
+    assert queue.put('job', {'job_id': None})
+    assert queue.put('job', {'job_id': None})
+    assert queue.counts() == {'pending': 3}